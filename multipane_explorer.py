@@ -1,8 +1,13 @@
 
 
-import os, sys, fnmatch, argparse, shutil, ctypes, math, subprocess, time, re, uuid, errno, stat
+import os, sys, fnmatch, shutil, ctypes, math, subprocess, time, re, errno, stat, threading, itertools, queue
+from array import array
+from collections import deque, OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
+from types import SimpleNamespace
 
 from PyQt5 import QtCore
 from PyQt5.QtCore import (
@@ -12,8 +17,8 @@ from PyQt5.QtCore import (
 )
 from PyQt5.QtGui import (
     QDesktopServices, QPalette, QColor, QKeySequence, QIcon,
-    QStandardItemModel, QStandardItem, QPainter, QPixmap, QPen, QBrush,
-    QCursor, QPolygonF, QGuiApplication, QFont
+    QPainter, QPixmap, QPen, QBrush,
+    QCursor, QPolygonF, QGuiApplication, QFont, QPixmapCache, QImage
 )
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QTreeView, QFileSystemModel,
@@ -22,13 +27,14 @@ from PyQt5.QtWidgets import (
     QMenu, QStyle, QHeaderView, QScrollArea, QFrame, QLabel, QShortcut,
     QToolButton, QDialog, QDialogButtonBox, QTableWidget, QTableWidgetItem,
     QCheckBox, QFileDialog, QProgressBar, QToolTip, QSizePolicy, QFileIconProvider,
-    QComboBox, QSpacerItem, QCompleter, QSpinBox, QStyledItemDelegate
+    QComboBox, QSpacerItem, QCompleter, QSpinBox, QStyledItemDelegate, QTableView
 )
 
 
+_TRUTHY = frozenset({"1", "true", "yes", "on", "y"})
+
 def _env_flag(name: str) -> bool:
-    v = os.environ.get(name, "")
-    return str(v).strip().lower() in {"1", "true", "yes", "on", "y"}
+    return os.environ.get(name, "").strip().lower() in _TRUTHY
 
 DEBUG = _env_flag("MULTIPANE_DEBUG")
 def dlog(msg):
@@ -65,10 +71,13 @@ CONTROL_HPAD= 6
 
 CRUMB_MAX_SEG_W = 180
 ALWAYS_GENERIC_ICONS = False
+CUSTOM_DIR_ICONS = _env_flag("MULTIPANE_CUSTOM_DIR_ICONS")
 SEARCH_RESULT_LIMIT = 50000
+SEARCH_WALK_THREADS = min(8, (os.cpu_count() or 4) * 2)
 FILEOP_SIZE_SCAN_FILE_LIMIT = 6000
 FILEOP_SIZE_SCAN_TIME_MS = 1200
 FILEOP_ERROR_DETAIL_LIMIT = 50
+FILEOP_FASTCOPY_SMALL_BYTES = 64 * 1024 * 1024
 LARGE_FOLDER_THRESHOLD = 3000
 GENERIC_ICON_THRESHOLD = 1200
 PATH_HISTORY_LIMIT = 30
@@ -81,6 +90,7 @@ SIZE_COL_WIDTH = 60
 DATE_COL_WIDTH = 122
 SEARCH_FOLDER_COL_WIDTH = 240
 LIST_DATETIME_FMT = "yyyy-MM-dd HH:mm"
+LIST_DATETIME_STRFTIME = "%Y-%m-%d %H:%M"  # LIST_DATETIME_FMT for time.strftime (usable off the GUI thread)
 HOVER_TOOLTIP_DURATION_MULTIPLIER = 9
 
 # Keep this list in sync with the README keyboard-shortcuts section.
@@ -356,6 +366,15 @@ def _enable_win_per_monitor_v2():
 os.environ.setdefault("QT_SCALE_FACTOR_ROUNDING_POLICY", "PassThrough")
 
 
+_HOME = None
+def _home() -> str:
+    global _HOME
+    if not _HOME:
+        _HOME = QDir.homePath()
+    return _HOME
+
+_SEPS = os.sep + (os.altsep or "")
+
 def _normalize_fs_path(p: str) -> str:
     try: p = os.path.normpath(p)
     except Exception: pass
@@ -368,6 +387,7 @@ def nice_path(p: str) -> str:
     try: return str(Path(p).resolve())
     except Exception: return _normalize_fs_path(p)
 
+@lru_cache(maxsize=8192)
 def _path_key(p: str) -> str:
     try:
         p = os.path.abspath(_normalize_fs_path(p))
@@ -384,17 +404,15 @@ def _paths_same(a: str, b: str) -> bool:
 def _is_subpath(child: str, parent: str) -> bool:
     child_key = _path_key(child)
     parent_key = _path_key(parent)
-    try:
-        return os.path.commonpath([child_key, parent_key]) == parent_key
-    except Exception:
-        # Different drives on Windows can raise ValueError here.
-        return False
+    return child_key == parent_key or child_key.startswith(parent_key.rstrip(_SEPS) + os.sep)
 
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB", "PB")
+@lru_cache(maxsize=4096)
 def human_size(n: int) -> str:
     if n is None: return ""
-    size = float(n); units = ["B", "KB", "MB", "GB", "TB", "PB"]; i = 0
-    while size >= 1024 and i < len(units)-1: size /= 1024.0; i += 1
-    if i == 0: return f"{int(size)} B"
+    if n < 1024: return f"{int(n)} B"
+    size = float(n); units = _SIZE_UNITS; i = 0
+    while size >= 1024 and i < 5: size /= 1024.0; i += 1
     return f"{size:.1f} {units[i]}" if size < 10 else f"{size:.0f} {units[i]}"
 
 def unique_dest_path(dst_dir: str, name: str) -> str:
@@ -737,26 +755,45 @@ def move_with_collision(src: str, dst_dir: str) -> str:
 
 def recycle_to_trash(paths: list, hwnd: int = 0) -> bool:
     if not paths: return True
+    paths = [p for p in paths if p and _path_exists_for_delete(p)]
+    if len(paths) > 1 and HAS_PYWIN32:
+        # One shell operation for the whole batch; per-path fallbacks only for what is left.
+        pFrom = "\0".join(_normalize_fs_path(p) for p in paths) + "\0\0"
+        try:
+            flags = (shellcon.FOF_ALLOWUNDO | shellcon.FOF_NOCONFIRMATION |
+                     shellcon.FOF_NOERRORUI | shellcon.FOF_SILENT)
+            shell.SHFileOperation((int(hwnd), shellcon.FO_DELETE, pFrom, None, flags, False, None, None))
+        except Exception as e:
+            if DEBUG: print("[delete] batched SHFileOperation failed:", e)
+        paths = [p for p in paths if _path_exists_for_delete(p)]
     ok = True
     for p in paths:
         if not recycle_path_to_trash(p, hwnd):
             ok = False
     return ok
 
+# Qt's default is 10240 KB, about 640 icon pixmaps at 64x64 ARGB (a 2x-DPI 32 px icon, 16 KB each). Six panes of
+# mixed file types plus style pixmaps overflow that and re-render on scroll, so allow 32 MiB.
+PIXMAP_CACHE_KB = 32768
+_ICON_CACHE = {}
+def _cached_icon(fn):
+    # Painted icons depend only on their arguments (theme/state), so each variant is drawn once.
+    def wrapper(*args):
+        key = (fn.__name__,) + args
+        icon = _ICON_CACHE.get(key)
+        if icon is None:
+            icon = _ICON_CACHE[key] = fn(*args)
+        return icon
+    wrapper.__name__ = fn.__name__
+    return wrapper
+
+@_cached_icon
 def icon_bookmark_edit(theme: str):
     def paint(p: QPainter, w, h):
         p.setRenderHint(QPainter.Antialiasing, True)
 
 
-        cx, cy = w/2 - 2, h/2 - 1
-        r_outer = min(w, h) * 0.40
-        r_inner = r_outer * 0.44
-        pts = []
-        for i in range(10):
-            ang = -math.pi/2 + i * (math.pi / 5.0)
-            r = r_outer if (i % 2 == 0) else r_inner
-            pts.append(QtCore.QPointF(cx + math.cos(ang) * r, cy + math.sin(ang) * r))
-        star = QPolygonF(pts)
+        star = _star_polygon(w/2 - 2, h/2 - 1, min(w, h) * 0.40, inner_ratio=0.44)
 
         fill = QColor(255, 210, 60) if theme == "dark" else QColor(255, 190, 0)
         stroke = QColor(160, 120, 0) if theme == "dark" else QColor(150, 110, 0)
@@ -798,6 +835,103 @@ def icon_bookmark_edit(theme: str):
 
 
 
+try:
+    # Bound once on a private handle so the process-wide windll.kernel32 prototype is left alone.
+    from ctypes import wintypes
+    _COPY_PROGRESS_ROUTINE = ctypes.WINFUNCTYPE(
+        wintypes.DWORD, ctypes.c_longlong, ctypes.c_longlong, ctypes.c_longlong, ctypes.c_longlong,
+        wintypes.DWORD, wintypes.DWORD, wintypes.HANDLE, wintypes.HANDLE, ctypes.c_void_p,
+    )
+    _COPY_FILE_EX = ctypes.WinDLL("kernel32", use_last_error=True).CopyFileExW
+    _COPY_FILE_EX.argtypes = [wintypes.LPCWSTR, wintypes.LPCWSTR, _COPY_PROGRESS_ROUTINE, ctypes.c_void_p, ctypes.c_void_p, wintypes.DWORD]
+    _COPY_FILE_EX.restype = wintypes.BOOL
+except Exception:
+    _COPY_PROGRESS_ROUTINE = _COPY_FILE_EX = None
+
+def _win_copy_file_ex(src: str, dst: str, on_progress, is_cancelled):
+    if _COPY_FILE_EX is None:
+        return None, 0
+    sent = [0]
+    try:
+        def _routine(_total, transferred, *_args):
+            delta = int(transferred) - sent[0]
+            if delta > 0:
+                sent[0] += delta
+                on_progress(delta)
+            return 1 if is_cancelled() else 0  # PROGRESS_CANCEL / PROGRESS_CONTINUE
+
+        cb = _COPY_PROGRESS_ROUTINE(_routine)
+        ok = _COPY_FILE_EX(src, dst, cb, None, None, 0)
+    except Exception as e:
+        if DEBUG: print("[copy] CopyFileExW failed:", e)
+        return None, sent[0]
+    if ok:
+        return True, sent[0]
+    return (False if is_cancelled() else None), sent[0]
+
+def _posix_copy_file(src: str, dst: str, on_progress, is_cancelled):
+    try:
+        size = os.stat(src).st_size
+    except OSError:
+        return None, 0
+    if size < FILEOP_FASTCOPY_SMALL_BYTES:
+        # shutil.copyfile already picks copy_file_range/sendfile/fcopyfile; progress per file is enough here.
+        try:
+            shutil.copyfile(src, dst)
+        except OSError:
+            return None, 0
+        on_progress(size)
+        return True, size
+    sent = 0
+    try:
+        sfd = os.open(src, os.O_RDONLY)
+    except OSError:
+        return None, 0
+    try:
+        dfd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    except OSError:
+        os.close(sfd)
+        return None, 0
+    use_range = hasattr(os, "copy_file_range")
+    try:
+        while True:
+            if is_cancelled():
+                return False, sent
+            if use_range:
+                try:
+                    n = os.copy_file_range(sfd, dfd, 8 << 20)
+                except OSError:
+                    # Older kernels reject cross-filesystem ranges (EXDEV); continue with sendfile.
+                    use_range = False
+                    continue
+            else:
+                n = os.sendfile(dfd, sfd, None, 8 << 20)
+            if not n:
+                return True, sent
+            sent += n
+            on_progress(n)
+    except OSError as e:
+        if DEBUG: print("[copy] sendfile failed:", e)
+        return None, sent
+    finally:
+        os.close(dfd); os.close(sfd)
+
+def _native_copy_file(src: str, dst: str, on_progress, is_cancelled):
+    """Kernel-side file copy; returns (True|False|None, bytes_reported), None meaning fall back."""
+    if sys.platform == "win32":
+        return _win_copy_file_ex(src, dst, on_progress, is_cancelled)
+    if hasattr(os, "sendfile"):
+        return _posix_copy_file(src, dst, on_progress, is_cancelled)
+    return None, 0
+
+
+def _lstat_or_none(path: str):
+    try:
+        return os.lstat(path)
+    except (OSError, ValueError):
+        return None
+
+
 class FileOpWorker(QtCore.QThread):
     progress = pyqtSignal(int)
     status = pyqtSignal(str)
@@ -815,109 +949,165 @@ class FileOpWorker(QtCore.QThread):
         self._done = 0
         self._count_progress = False
         self._last_progress_pct = -1
-        self._last_progress_emit_ts = 0.0
         self._src_size_cache = {}
         self.errors = []
         self.error_count = 0
         self.undo_remove_paths = []
         self.undo_move_pairs = []
+        self._status_queue = deque()
+        self._scanned_files = 0
+        self._chunk = 1024 * 1024
+        self._copy_buf = None
+        self._pump_stop = None
+        self._pump = None
 
     def cancel(self): self._cancel = True
 
     def _iter_files(self, path):
         if os.path.isdir(path) and not os.path.islink(path):
-            for root, dirs, files in os.walk(path):
-                for f in files:
-                    fp = os.path.join(root, f)
-                    try: size = os.path.getsize(fp)
-                    except Exception: size = 0
-                    yield fp, size
+            stack = [path]
+            while stack:
+                try: it = os.scandir(stack.pop())
+                except OSError: continue
+                with it:
+                    for e in it:
+                        try:
+                            if e.is_dir(follow_symlinks=False):
+                                stack.append(e.path); continue
+                            if e.is_symlink() and e.is_dir():
+                                continue
+                            size = e.stat(follow_symlinks=False).st_size
+                        except OSError:
+                            size = 0
+                        yield e.path, size
         else:
-            try: size = os.path.getsize(path)
+            try: size = os.stat(path, follow_symlinks=False).st_size
             except Exception: size = 0
             yield path, size
 
     def _size_of(self, path) -> int:
         return sum(sz for _, sz in self._iter_files(path))
 
+    def _scan_source(self, src, deadline, stop, counter):
+        src_total = 0
+        for _fp, sz in self._iter_files(src):
+            src_total += max(0, int(sz or 0))
+            if (next(counter) >= FILEOP_SIZE_SCAN_FILE_LIMIT or stop.is_set() or self._cancel
+                    or time.perf_counter() >= deadline):
+                stop.set()
+                return src, src_total, False
+        return src, src_total, True
+
     def _calc_total(self):
-        scanned = 0
-        total = 0
         self._src_size_cache = {}
-        deadline = time.perf_counter() + (FILEOP_SIZE_SCAN_TIME_MS / 1000.0)
+        if len(self.srcs) >= FILEOP_SIZE_SCAN_FILE_LIMIT:
+            # The scan could never finish within the file limit; go straight to count-based progress.
+            self._count_progress = True
+            self._total = len(self.srcs)
+            self._done = 0
+            return
+        sizes = {}
         for s in self.srcs:
-            if self._cancel:
+            st = _lstat_or_none(s)
+            if st is not None and stat.S_ISDIR(st.st_mode):
+                sizes = None
                 break
-            skey = _path_key(s)
-            if os.path.isdir(s) and not os.path.islink(s):
-                src_total = 0
-                for _fp, sz in self._iter_files(s):
-                    cur = max(0, int(sz or 0))
-                    src_total += cur
-                    total += cur
-                    scanned += 1
-                    if scanned >= FILEOP_SIZE_SCAN_FILE_LIMIT or time.perf_counter() >= deadline:
-                        # Switch to count-based progress when size scan is too large/slow.
-                        self._src_size_cache[skey] = src_total
-                        self._count_progress = True
-                        self._total = max(1, scanned, len(self.srcs))
-                        self._done = 0
-                        return
-                self._src_size_cache[skey] = src_total
-            else:
-                src_total = 0
+            sizes[_path_key(s)] = st.st_size if st is not None else 0
+        if sizes is not None:
+            # Files only: one lstat each is the whole scan, no deadline needed.
+            self._src_size_cache = sizes
+            self._scanned_files = len(sizes)
+            self._count_progress = False
+            self._total = max(1, sum(sizes.values()))
+            self._last_progress_pct = -1
+            return
+        total = 0
+        complete = True
+        deadline = time.perf_counter() + (FILEOP_SIZE_SCAN_TIME_MS / 1000.0)
+        stop = threading.Event()
+        counter = itertools.count(1)
+        # Scan sources concurrently so one slow drive/share does not hold up the others.
+        with ThreadPoolExecutor(max_workers=max(1, min(8, len(self.srcs)))) as pool:
+            futures = [pool.submit(self._scan_source, s, deadline, stop, counter) for s in self.srcs]
+            for fut in as_completed(futures):
                 try:
-                    src_total = max(0, int(os.path.getsize(s)))
-                    total += src_total
+                    src, src_total, done = fut.result()
                 except Exception:
-                    pass
-                self._src_size_cache[skey] = src_total
-                scanned += 1
-                if scanned >= FILEOP_SIZE_SCAN_FILE_LIMIT or time.perf_counter() >= deadline:
-                    self._count_progress = True
-                    self._total = max(1, scanned, len(self.srcs))
-                    self._done = 0
-                    return
+                    continue
+                self._src_size_cache[_path_key(src)] = src_total
+                total += src_total
+                if not done and complete:
+                    complete = False
+                    for f in futures: f.cancel()
+        if not complete and not self._cancel:
+            # Switch to count-based progress when size scan is too large/slow.
+            scanned = next(counter) - 1
+            self._count_progress = True
+            self._total = max(1, scanned, len(self.srcs))
+            self._done = 0
+            return
+        self._scanned_files = next(counter) - 1
         self._count_progress = False
         self._total = max(1, total)
         self._last_progress_pct = -1
-        self._last_progress_emit_ts = 0.0
+
+    def _pick_chunk(self) -> int:
+        chunk = 1024 * 1024
+        if not self._count_progress and self._src_size_cache:
+            largest = max(self._src_size_cache.values())
+            if self._total > (1 << 30) and largest > (64 << 20):
+                chunk = 8 << 20
+            elif self._scanned_files and self._total // self._scanned_files < (512 << 10):
+                chunk = 256 << 10
+        try:
+            chunk = max(chunk, os.statvfs(self.dst_dir).f_bsize)
+        except (AttributeError, OSError):
+            pass
+        return chunk
 
     def _emit_progress(self, force: bool = False):
         total = max(1, int(self._total or 1))
         pct = min(100, int(self._done * 100 / total))
         if not force:
             pct = min(99, pct)
-        now = time.perf_counter()
-        should_emit = (
-            force
-            or pct >= 100
-            or self._last_progress_pct < 0
-            or (
-                pct > self._last_progress_pct
-                and (
-                    (pct - self._last_progress_pct) >= 1
-                    or (now - self._last_progress_emit_ts) >= 0.05
-                )
-            )
-        )
-        if not should_emit:
-            return
+            if pct <= self._last_progress_pct:
+                return
         self._last_progress_pct = pct
-        self._last_progress_emit_ts = now
         self.progress.emit(pct)
 
     def _tick_progress(self, delta_bytes):
         if self._count_progress:
             return
         self._done += max(0, int(delta_bytes))
-        self._emit_progress()
 
     def _tick_count_unit(self, units: int = 1):
         if not self._count_progress:
             return
         self._done += max(0, int(units))
-        self._emit_progress()
+
+    def _queue_status(self, prefix: str, name: str):
+        self._status_queue.append((prefix, name))
+
+    def _flush_status(self):
+        q = self._status_queue
+        if not q:
+            return
+        last = None; counts = {}
+        while True:
+            try: last = q.popleft()
+            except IndexError: break
+            counts[last[0]] = counts.get(last[0], 0) + 1
+        # Only same-prefix messages fold into "(+n more)"; other kinds keep their own label and count.
+        prefix, name = last; n = counts.pop(prefix)
+        parts = [prefix + name + (f" (+{n - 1} more)" if n > 1 else "")]
+        parts += [f"{p.rstrip(': ')} ({c})" for p, c in counts.items()]
+        self.status.emit("; ".join(parts))
+
+    def _progress_pump(self, stop):
+        # Progress/status signals are emitted from here at most every 50 ms instead of per item.
+        while not stop.wait(0.05):
+            self._emit_progress()
+            self._flush_status()
 
     def _skip_source_progress(self, src):
         if self._count_progress:
@@ -931,22 +1121,33 @@ class FileOpWorker(QtCore.QThread):
             delta = self._size_of(src)
         self._tick_progress(delta)
 
-    def _emit_source_done(self):
-        self._emit_progress()
-
     def _copy_file(self, src, dst):
         copied = 0
         try:
             os.makedirs(os.path.dirname(dst), exist_ok=True)
-            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
-                while True:
-                    if self._cancel:
-                        return False
-                    buf = fsrc.read(1024 * 1024)
-                    if not buf: break
-                    fdst.write(buf)
-                    copied += len(buf)
-                    self._tick_progress(len(buf))
+            res, copied = _native_copy_file(src, dst, self._tick_progress, lambda: self._cancel)
+            if res is False:
+                return False
+            if res is None:
+                # Fallback stream copy; bytes already reported by the native attempt are not re-counted.
+                reported = copied; pos = 0
+                if self._copy_buf is None or len(self._copy_buf) != self._chunk:
+                    self._copy_buf = bytearray(self._chunk)
+                buf = self._copy_buf; mv = memoryview(buf)
+                # Unbuffered handles + one reused buffer: no per-chunk bytes objects or extra copies.
+                with open(src, "rb", buffering=0) as fsrc, open(dst, "wb", buffering=0) as fdst:
+                    while True:
+                        if self._cancel:
+                            return False
+                        n = fsrc.readinto(buf)
+                        if not n: break
+                        chunk = mv[:n]
+                        while chunk:
+                            chunk = chunk[fdst.write(chunk):]
+                        pos += n
+                        if pos > reported:
+                            self._tick_progress(pos - max(reported, pos - n))
+                        copied = max(reported, pos)
             self._tick_count_unit(1)
             try: shutil.copystat(src, dst, follow_symlinks=True)
             except Exception: pass
@@ -972,7 +1173,7 @@ class FileOpWorker(QtCore.QThread):
         if len(self.errors) < FILEOP_ERROR_DETAIL_LIMIT:
             self.errors.append(f"{src} -> {dst}: {exc}")
         name = os.path.basename(str(src).rstrip("\\/")) or str(src)
-        self.status.emit(f"Failed: {name}")
+        self._queue_status("Failed: ", name)
 
     def _can_undo_new_destination(self, existed_before: bool, action: str | None) -> bool:
         return (not existed_before) or action == "copy"
@@ -992,22 +1193,41 @@ class FileOpWorker(QtCore.QThread):
 
     def _copy_dir_recursive(self, src_dir, dst_dir):
         ok = True
-        for root, dirs, files in os.walk(src_dir):
+        stack = [(src_dir, dst_dir)]
+        while stack:
             if self._cancel: return ok
-            rel = os.path.relpath(root, src_dir)
-            target_root = os.path.join(dst_dir, "" if rel == "." else rel)
+            root, target_root = stack.pop()
+            files = []
+            try:
+                with os.scandir(root) as it:
+                    for e in it:
+                        try:
+                            if e.is_dir(follow_symlinks=False):
+                                stack.append((e.path, os.path.join(target_root, e.name))); continue
+                            if e.is_symlink() and e.is_dir():
+                                continue
+                        except OSError:
+                            pass
+                        files.append(e)
+            except OSError as e:
+                self._record_copy_error(root, target_root, e)
+                ok = False
+                continue
             try:
                 os.makedirs(target_root, exist_ok=True)
             except Exception as e:
                 self._record_copy_error(root, target_root, e)
                 for f in files:
-                    self._skip_file_progress(os.path.join(root, f))
+                    self._skip_file_progress(f.path)
                 ok = False
                 continue
+            if os.name != "nt" and len(files) > 1:
+                # Copy in inode order; d_ino is free from scandir on POSIX (it costs a stat on Windows).
+                files.sort(key=lambda f: f.inode())
             for f in files:
                 if self._cancel: return ok
-                sfile = os.path.join(root, f)
-                dfile = os.path.join(target_root, f)
+                sfile = f.path
+                dfile = os.path.join(target_root, f.name)
                 try:
                     self._copy_file(sfile, dfile)
                 except Exception as e:
@@ -1015,9 +1235,28 @@ class FileOpWorker(QtCore.QThread):
                     ok = False
         return ok
 
+    def _stop_pump(self):
+        stop, pump = self._pump_stop, self._pump
+        if stop is not None:
+            stop.set()
+        if pump is not None:
+            pump.join()
+        self._pump_stop = self._pump = None
+
     def run(self):
+        # Only the pump emits progress while ops run; it is joined before the final 100% so no stale value follows it.
+        self._pump_stop = threading.Event()
+        self._pump = threading.Thread(target=self._progress_pump, args=(self._pump_stop,), daemon=True)
+        self._pump.start()
+        try:
+            self._run_ops()
+        finally:
+            self._stop_pump()
+
+    def _run_ops(self):
         try:
             self._calc_total()
+            self._chunk = self._pick_chunk()
             if self._count_progress:
                 self.status.emit(f"Preparing {self.op} (quick estimate) ...")
             else:
@@ -1025,56 +1264,66 @@ class FileOpWorker(QtCore.QThread):
 
             for src in self.srcs:
                 if self._cancel: break
-                if not os.path.exists(src):
+                # One lstat per side decides routing instead of exists/isdir/islink/samefile probes.
+                src_st = _lstat_or_none(src)
+                if src_st is None or (stat.S_ISLNK(src_st.st_mode) and not os.path.exists(src)):
                     self._skip_source_progress(src)
-                    self._emit_source_done()
                     continue
+                src_is_dir = stat.S_ISDIR(src_st.st_mode)
 
                 base = os.path.basename(src.rstrip("\\/")) or os.path.basename(src)
                 dst = os.path.join(self.dst_dir, base)
-
-
-                if _paths_same(src, dst):
+                dst_st = _lstat_or_none(dst)
+                if dst_st is not None and stat.S_ISLNK(dst_st.st_mode) and not os.path.exists(dst):
+                    dst_st = None
+                dst_is_dir = dst_st is not None and stat.S_ISDIR(dst_st.st_mode)
+
+                if dst_st is None:
+                    same = False
+                elif src_st.st_ino and not (stat.S_ISLNK(src_st.st_mode) or stat.S_ISLNK(dst_st.st_mode)):
+                    same = (src_st.st_dev, src_st.st_ino) == (dst_st.st_dev, dst_st.st_ino)
+                else:
+                    same = _paths_same(src, dst)
+                if same:
                     if self.op == "copy":
                         dst = unique_dest_path(self.dst_dir, base)
+                        dst_st = None; dst_is_dir = False
                     else:
-                        self.status.emit(f"Skipped same path: {base}")
+                        self._queue_status("Skipped same path: ", base)
                         self._skip_source_progress(src)
-                        self._emit_source_done()
                         continue
 
 
-                if os.path.isdir(src) and not os.path.islink(src) and _is_subpath(dst, src):
+                if src_is_dir and _is_subpath(dst, src):
                     # Prevent copying/moving a folder into its own subtree.
-                    self.status.emit(f"Skipped nested destination: {base}")
+                    self._queue_status("Skipped nested destination: ", base)
                     self._skip_source_progress(src)
-                    self._emit_source_done()
                     continue
 
-                exists = os.path.exists(dst)
+                exists = dst_st is not None
                 action = self.conflict_map.get(src) if exists else None
 
 
                 if self.op == "copy":
-                    if os.path.isdir(src) and not os.path.islink(src):
+                    if src_is_dir:
                         created_for_undo = self._can_undo_new_destination(exists, action)
                         if exists:
                             if action == "skip":
-                                self._skip_source_progress(src); self._emit_source_done(); continue
+                                self._skip_source_progress(src); continue
                             elif action == "copy":
                                 dst = unique_dest_path(self.dst_dir, base)
                             elif action == "overwrite":
-                                if not (os.path.isdir(dst) and not os.path.islink(dst)):
+                                if not dst_is_dir:
                                     try:
                                         remove_any(dst)
                                     except Exception as e:
                                         self._record_copy_error(src, dst, e)
-                                        self._skip_source_progress(src); self._emit_source_done(); continue
+                                        self._skip_source_progress(src); continue
                         try:
                             os.makedirs(dst, exist_ok=True)
                         except Exception as e:
                             self._record_copy_error(src, dst, e)
-                            self._skip_source_progress(src); self._emit_source_done(); continue
+                            self._skip_source_progress(src); continue
                         copied_ok = self._copy_dir_recursive(src, dst)
                         if copied_ok and created_for_undo:
                             self._remember_created_for_undo(dst)
@@ -1082,15 +1331,15 @@ class FileOpWorker(QtCore.QThread):
                         created_for_undo = self._can_undo_new_destination(exists, action)
                         if exists:
                             if action == "skip":
-                                self._skip_source_progress(src); self._emit_source_done(); continue
+                                self._skip_source_progress(src); continue
                             elif action == "copy":
                                 dst = unique_dest_path(self.dst_dir, base)
-                            elif action == "overwrite" and os.path.isdir(dst) and not os.path.islink(dst):
+                            elif action == "overwrite" and dst_is_dir:
                                 try:
                                     shutil.rmtree(dst)
                                 except Exception as e:
                                     self._record_copy_error(src, dst, e)
-                                    self._skip_source_progress(src); self._emit_source_done(); continue
+                                    self._skip_source_progress(src); continue
 
                         try:
                             copied_ok = self._copy_file(src, dst)
@@ -1106,16 +1355,20 @@ class FileOpWorker(QtCore.QThread):
                     src_progress_size = self._src_size_cache.get(_path_key(src))
                     if exists:
                         if action == "skip":
-                            self._skip_source_progress(src); self._emit_source_done(); continue
+                            self._skip_source_progress(src); continue
                         elif keep_both:
                             dst = unique_dest_path(self.dst_dir, base)
                         elif action == "overwrite":
                             try:
-                                if os.path.isdir(dst) and not os.path.islink(dst): shutil.rmtree(dst)
+                                if dst_is_dir: shutil.rmtree(dst)
                                 else: os.remove(dst)
                             except Exception: pass
                     try:
-                        final = shutil.move(src, dst if keep_both else self.dst_dir)
+                        if stat.S_ISLNK(src_st.st_mode):
+                            final = shutil.move(src, dst if keep_both else self.dst_dir)
+                        else:
+                            # Same-volume rename; EXDEV and other failures use the fast copy+delete path below.
+                            os.rename(src, dst); final = dst
                         if src_progress_size is None:
                             src_progress_size = self._size_of(final if os.path.exists(final) else src)
                         self._tick_progress(src_progress_size)
@@ -1124,7 +1377,7 @@ class FileOpWorker(QtCore.QThread):
                             self._remember_move_for_undo(final, src)
                     except Exception:
                         # Cross-device move or permission failures: fall back to copy.
-                        if os.path.isdir(src) and not os.path.islink(src):
+                        if src_is_dir:
                             if os.path.exists(dst) and action == "overwrite":
                                 try: shutil.rmtree(dst)
                                 except Exception: pass
@@ -1134,7 +1387,7 @@ class FileOpWorker(QtCore.QThread):
                                 os.makedirs(dst, exist_ok=True)
                             except Exception as e:
                                 self._record_copy_error(src, dst, e)
-                                self._skip_source_progress(src); self._emit_source_done(); continue
+                                self._skip_source_progress(src); continue
                             copied_ok = self._copy_dir_recursive(src, dst)
                             removed_src = False
                             if not self._cancel and copied_ok:
@@ -1166,8 +1419,8 @@ class FileOpWorker(QtCore.QThread):
                             if removed_src and can_undo_move:
                                 self._remember_move_for_undo(dst, src)
 
-                self._emit_source_done()
-
+            self._stop_pump()
+            self._flush_status()
             if self._cancel:
                 self.error.emit("Operation cancelled."); return
             self._done = max(self._done, self._total)
@@ -1287,8 +1540,7 @@ class DeleteWorker(QtCore.QThread):
                     pass
 
 
-def _common_css():
-    return f"""
+_COMMON_CSS = f"""
     QWidget {{ font-family: Segoe UI, Pretendard, "Noto Sans", sans-serif; font-size: {FONT_PT}pt; }}
     QScrollArea, QAbstractScrollArea {{ padding: 0; margin: 0; border: 0; }}
     QAbstractScrollArea::viewport {{ margin: 0; padding: 0; }}
@@ -1304,21 +1556,31 @@ def _common_css():
     QLabel#crumbSep {{ padding: 0 0px; margin: 0; }}
     """
 
+_STAR_UNIT = tuple(
+    (math.cos(-math.pi/2 + i * math.pi/5), math.sin(-math.pi/2 + i * math.pi/5), i % 2 == 0)
+    for i in range(10)
+)
+
 def _star_polygon(cx, cy, r, inner_ratio=0.45):
+    ri = r * inner_ratio
     return QPolygonF([
-        QtCore.QPointF(cx + math.cos(-math.pi/2 + i * math.pi/5) * (r if i % 2 == 0 else r * inner_ratio),
-                       cy + math.sin(-math.pi/2 + i * math.pi/5) * (r if i % 2 == 0 else r * inner_ratio))
-        for i in range(10)
+        QtCore.QPointF(cx + x * (r if outer else ri), cy + y * (r if outer else ri))
+        for x, y, outer in _STAR_UNIT
     ])
 
-def _setup_readonly_table(table: QTableWidget, labels, resize_modes, row_count=None):
+def _setup_readonly_table(table: QTableWidget, labels, resize_modes, row_count=None, cell_widgets=False):
     table.setColumnCount(len(labels)); table.setHorizontalHeaderLabels(list(labels))
-    if row_count is not None: table.setRowCount(row_count)
     header = table.horizontalHeader()
     for col, mode in enumerate(resize_modes):
         header.setSectionResizeMode(col, mode)
-    table.setSelectionBehavior(QAbstractItemView.SelectRows)
-    table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+    if cell_widgets:
+        # Rows are made of editor widgets only: no item selection, fixed row height.
+        table.setSelectionMode(QAbstractItemView.NoSelection)
+        table.verticalHeader().setDefaultSectionSize(UI_H + 2 * ROW_SPACING)
+    else:
+        table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+    if row_count is not None: table.setRowCount(row_count)
     return table
 
 def _set_table_row_items(table: QTableWidget, row: int, *values):
@@ -1332,8 +1594,8 @@ def _add_dialog_button_box(layout, parent, buttons, accept_slot, reject_slot=Non
     layout.addWidget(btns)
     return btns
 
-def _empty_bookmark_item():
-    return {"enabled": False, "name": "", "path": ""}
+# Shared read-only default for empty bookmark rows; never mutate.
+_EMPTY_BOOKMARK = {"enabled": False, "name": "", "path": ""}
 
 def _apply_palette_colors(widget, colors):
     pal = widget.palette()
@@ -1439,10 +1701,25 @@ _THEME_STYLE_SPECS = {
     },
 }
 
+_THEME_CSS = {
+    name: _COMMON_CSS + (_THEME_CSS_TEMPLATE % spec["css"])
+    for name, spec in _THEME_STYLE_SPECS.items()
+}
+
+_THEME_PALETTES = {}
+
 def _apply_theme(app: QApplication, theme: str):
-    spec = _THEME_STYLE_SPECS["light" if theme == "light" else "dark"]
-    _apply_palette_colors(app, spec["palette"])
-    app.setStyleSheet(_common_css() + (_THEME_CSS_TEMPLATE % spec["css"]))
+    key = "light" if theme == "light" else "dark"
+    pal = _THEME_PALETTES.get(key)
+    if pal is None:
+        pal = QPalette(app.palette())
+        for role, rgb in _THEME_STYLE_SPECS[key]["palette"].items(): pal.setColor(role, QColor(*rgb))
+        _THEME_PALETTES[key] = pal
+    if app.palette() != pal:
+        app.setPalette(pal)
+    css = _THEME_CSS[key]
+    if app.styleSheet() != css:
+        app.setStyleSheet(css)
 
 def apply_dark_style(app: QApplication): _apply_theme(app, "dark")
 def apply_light_style(app: QApplication): _apply_theme(app, "light")
@@ -1450,6 +1727,7 @@ def apply_theme_by_name(app: QApplication, theme: str): _apply_theme(app, theme)
 
 
 
+@_cached_icon
 def icon_copy_squares(theme: str):
     def paint(p: QPainter, w, h):
         stroke = QColor(210, 214, 225) if theme == "dark" else QColor(85, 95, 115)
@@ -1464,13 +1742,14 @@ def icon_copy_squares(theme: str):
         p.drawRoundedRect(front_rect, radius, radius)
         p.drawRoundedRect(back_rect, radius, radius)
     return _make_icon(20, 20, paint)
-def _make_icon(w, h, painter_fn):
-    pm = QPixmap(w, h); pm.fill(Qt.transparent)
-    p = QPainter(pm); p.setRenderHint(QPainter.Antialiasing, True)
+def _make_icon(w, h, painter_fn, antialias=True):
+    img = QImage(w, h, QImage.Format_ARGB32_Premultiplied); img.fill(Qt.transparent)
+    p = QPainter(img); p.setRenderHint(QPainter.Antialiasing, antialias)
     try: painter_fn(p, w, h)
     finally: p.end()
-    return QIcon(pm)
+    return QIcon(QPixmap.fromImage(img))
 
+@_cached_icon
 def icon_grid_layout(state: int, theme: str):
     def paint(p: QPainter, w, h):
         pen = QPen(QColor(180,180,190) if theme=="dark" else QColor(90,90,100), 1.6)
@@ -1481,8 +1760,9 @@ def icon_grid_layout(state: int, theme: str):
             for c in range(cols):
                 x = int(margin + c * cellw + 0.5); y = int(margin + r * cellh + 0.5)
                 p.drawRect(x, y, int(cellw-3), int(cellh-3))
-    return _make_icon(22, 22, paint)
+    return _make_icon(22, 22, paint, antialias=False)
 
+@_cached_icon
 def icon_theme_toggle(theme: str):
     def paint(p: QPainter, w, h):
         cx, cy, r = w/2, h/2, min(w,h)/3
@@ -1501,6 +1781,7 @@ def icon_theme_toggle(theme: str):
             p.drawEllipse(QtCore.QPointF(cx + r*0.45, cy - r*0.2), r*0.9, r*0.9)
     return _make_icon(22, 22, paint)
 
+@_cached_icon
 def icon_session(theme: str):
     def paint(p: QPainter, w, h):
         p.setRenderHint(QPainter.Antialiasing, True)
@@ -1519,6 +1800,7 @@ def icon_session(theme: str):
         p.setBrush(QBrush(star_fill))
         p.drawPolygon(_star_polygon(w - 6.0, h - 6.0, 3.2, inner_ratio=0.44))
     return _make_icon(22, 22, paint)
+@_cached_icon
 def icon_star(checked: bool, theme: str):
     def paint(p: QPainter, w, h):
         poly = _star_polygon(w/2, h/2, min(w,h)/2.6)
@@ -1529,6 +1811,7 @@ def icon_star(checked: bool, theme: str):
         p.drawPolygon(poly)
     return _make_icon(20, 20, paint)
 
+@_cached_icon
 def icon_edit(theme: str):
     def paint(p: QPainter, w, h):
         p.setRenderHint(QPainter.Antialiasing, True)
@@ -1538,6 +1821,7 @@ def icon_edit(theme: str):
         p.setBrush(QBrush(QColor(240, 200, 80))); p.drawPolygon(tri)
     return _make_icon(22, 22, paint)
 
+@_cached_icon
 def icon_info(theme: str):
     def paint(p: QPainter, w, h):
         c = QColor(160,190,255) if theme=="dark" else QColor(60,90,200)
@@ -1546,6 +1830,7 @@ def icon_info(theme: str):
         p.drawPoint(w//2, h//2-4); p.drawLine(w//2, h//2-2, w//2, h//2+6)
     return _make_icon(22, 22, paint)
 
+@_cached_icon
 def icon_shortcuts(theme: str):
     def paint(p: QPainter, w, h):
         border = QColor(180, 200, 255) if theme == "dark" else QColor(70, 100, 210)
@@ -1563,6 +1848,7 @@ def icon_shortcuts(theme: str):
         p.drawLine(6, 16, w - 6, 16)
     return _make_icon(22, 22, paint)
 
+@_cached_icon
 def icon_cmd(theme: str):
     def paint(p: QPainter, w, h):
         border = QColor(190, 195, 210) if theme=="dark" else QColor(90, 100, 120)
@@ -1575,6 +1861,7 @@ def icon_cmd(theme: str):
         p.drawLine(6, h//2, 10, h//2-3); p.drawLine(6, h//2, 10, h//2+3); p.drawLine(12, h//2+5, w-6, h//2+5)
     return _make_icon(22, 22, paint)
 
+@_cached_icon
 def icon_explorer(theme: str):
     def paint(p: QPainter, w, h):
         line = QColor(190, 195, 210) if theme=="dark" else QColor(90, 100, 120)
@@ -1603,8 +1890,30 @@ class GenericIconProvider(QFileIconProvider):
             return self._file
 
 
+_ICON_PROVIDERS = None
+
+def _shared_icon_providers():
+    # One native and one generic provider for the whole app: the first pane pays for the style icons and
+    # the native provider's icon cache is shared by every pane's model instead of warmed per pane.
+    global _ICON_PROVIDERS
+    if _ICON_PROVIDERS is None:
+        native = QFileIconProvider()
+        if not CUSTOM_DIR_ICONS:
+            # Custom folder icons cost a desktop.ini read per directory; opt back in with MULTIPANE_CUSTOM_DIR_ICONS=1.
+            try: native.setOptions(QFileIconProvider.DontUseCustomDirectoryIcons)
+            except Exception: pass
+        _ICON_PROVIDERS = (native, GenericIconProvider(QApplication.style()))
+    return _ICON_PROVIDERS
+
+
 class _MSG(ctypes.Structure):
     _fields_=[("hwnd",ctypes.c_void_p),("message",ctypes.c_uint),("wParam",ctypes.c_size_t),("lParam",ctypes.c_size_t),("time",ctypes.c_uint),("pt_x",ctypes.c_long),("pt_y",ctypes.c_long)]
+_MSG_MESSAGE_OFFSET = _MSG.message.offset
+if HAS_PYWIN32:
+    _MENU_MSGS = frozenset((win32con.WM_INITMENU, win32con.WM_INITMENUPOPUP, win32con.WM_DRAWITEM, win32con.WM_MEASUREITEM, win32con.WM_MENUCHAR))
+    _WM_MENUCHAR = win32con.WM_MENUCHAR
+else:
+    _MENU_MSGS = frozenset(); _WM_MENUCHAR = None
 
 class WinCtxMenuEventFilter(QtCore.QAbstractNativeEventFilter):
     def __init__(self): super().__init__(); self._cm2=None; self._cm3=None
@@ -1620,10 +1929,11 @@ class WinCtxMenuEventFilter(QtCore.QAbstractNativeEventFilter):
     def nativeEventFilter(self, eventType, message):
         if eventType != 'windows_generic_MSG': return False, 0
         if not (self._cm2 or self._cm3): return False, 0
-        msg = _MSG.from_address(int(message)); m = msg.message
-        if HAS_PYWIN32 and m in (win32con.WM_INITMENU, win32con.WM_INITMENUPOPUP, win32con.WM_DRAWITEM, win32con.WM_MEASUREITEM, win32con.WM_MENUCHAR):
+        addr = int(message); m = ctypes.c_uint.from_address(addr + _MSG_MESSAGE_OFFSET).value
+        if m in _MENU_MSGS:
+            msg = _MSG.from_address(addr)
             try:
-                if self._cm3 and m == win32con.WM_MENUCHAR:
+                if self._cm3 and m == _WM_MENUCHAR:
                     handled, result = self._cm3.HandleMenuMsg2(int(m), int(msg.wParam), int(msg.lParam))
                     return bool(handled), int(result or 0)
                 cm = self._cm3 or self._cm2
@@ -1652,8 +1962,41 @@ def _as_interface(obj):
     if isinstance(obj,int): return None
     return obj
 
+SHELL_MENU_MAX = 16
+
+_SH_PARSE_FNS = None
+def _sh_parse_fns():
+    # Bound once: shell32!SHParseDisplayName + ole32!CoTaskMemFree with fixed prototypes.
+    global _SH_PARSE_FNS
+    if _SH_PARSE_FNS is None:
+        try:
+            parse = ctypes.WinDLL("shell32", use_last_error=True).SHParseDisplayName
+            parse.argtypes = [ctypes.c_wchar_p, ctypes.c_void_p, ctypes.POINTER(ctypes.c_void_p), ctypes.c_ulong, ctypes.POINTER(ctypes.c_ulong)]
+            parse.restype = ctypes.c_long
+            free = ctypes.WinDLL("ole32").CoTaskMemFree
+            free.argtypes = [ctypes.c_void_p]; free.restype = None
+            _SH_PARSE_FNS = (parse, free)
+        except Exception:
+            _SH_PARSE_FNS = ()
+    return _SH_PARSE_FNS
+
+try:
+    _SH_OBJECT_PROPERTIES = ctypes.WinDLL("shell32").SHObjectProperties
+    _SH_OBJECT_PROPERTIES.argtypes = [ctypes.c_void_p, ctypes.c_uint, ctypes.c_wchar_p, ctypes.c_wchar_p]
+    _SH_OBJECT_PROPERTIES.restype = ctypes.c_int
+except Exception:
+    _SH_OBJECT_PROPERTIES = None
+
 def _abs_pidl(path_str):
-    pidl, _attrs = shell.SHParseDisplayName(_normalize_fs_path(path_str), 0)
+    path_str = _normalize_fs_path(path_str)
+    fns = _sh_parse_fns()
+    if fns:
+        parse, free = fns; raw = ctypes.c_void_p()
+        if parse(path_str, None, ctypes.byref(raw), 0, None) == 0 and raw.value:
+            try: return shell.AddressAsPIDL(raw.value)
+            except Exception: pass
+            finally: free(raw)
+    pidl, _attrs = shell.SHParseDisplayName(path_str, 0)
     return pidl
 
 def _bind_folder(path_str):
@@ -1661,12 +2004,12 @@ def _bind_folder(path_str):
     pidl = _abs_pidl(path_str)
     return desktop.BindToObject(pidl, None, shell.IID_IShellFolder)
 
-def _icm_via_shellitems(paths):
+def _icm_via_shellitems(paths, pidls=None):
     try:
         if len(paths) == 1:
             it = shell.SHCreateItemFromParsingName(_normalize_fs_path(paths[0]), None, shell.IID_IShellItem)
             return _as_interface(it.BindToHandler(None, shell.BHID_SFUIObject, shell.IID_IContextMenu))
-        pidls = tuple(_abs_pidl(p) for p in paths)
+        if pidls is None: pidls = tuple(_abs_pidl(p) for p in paths)
         try: sia = shell.SHCreateShellItemArrayFromIDLists(pidls)
         except Exception: return None
         return _as_interface(sia.BindToHandler(None, shell.BHID_SFUIObject, shell.IID_IContextMenu))
@@ -1694,6 +2037,12 @@ def _get_canonical_verb(cm, idx):
         except Exception: pass
     return (verb or "").strip().lower()
 
+def _ctx_menu_flags() -> int:
+    # Extended verbs make every handler populate its hidden entries; only ask for them while Shift is held.
+    flags = shellcon.CMF_NORMAL|shellcon.CMF_EXPLORE|shellcon.CMF_INCLUDESTATIC
+    if win32api.GetKeyState(win32con.VK_SHIFT)<0: flags |= shellcon.CMF_EXTENDEDVERBS
+    return flags
+
 def _query_ctx_menu_id_last(cm, hmenu, id_first: int, flags: int, id_limit: int = 0x7FFF) -> int:
     qret = cm.QueryContextMenu(hmenu, 0, int(id_first), int(id_limit), int(flags))
     count = int(qret) & 0xFFFF
@@ -1739,37 +2088,51 @@ def _launch_powershell_here(owner_hwnd, work_dir: str, paths=None) -> bool:
         if DEBUG: print("[ctx] direct PowerShell launch failed:", e)
         return False
 
+# "git" and "bash" in either order within one line; verb and menu text are joined by a newline so they never match across.
+_GIT_BASH_RE = re.compile(r"git.*bash|bash.*git")
+
 def _is_git_bash_action(verb: str | None, menu_text: str | None) -> bool:
-    v = (verb or "").strip().lower()
-    t = (menu_text or "").strip().lower()
-    if not v and not t:
+    if not verb and not menu_text:
         return False
-    if ("git bash" in v) or ("git bash" in t):
-        return True
-    if ("git-bash" in v) or ("git_bash" in v) or ("gitbash" in v):
-        return True
+    v = (verb or "").lower()
     if "git_shell" in v:
         return True
-    return ("git" in v and "bash" in v) or ("git" in t and "bash" in t)
+    return _GIT_BASH_RE.search(v + "\n" + (menu_text or "").lower()) is not None
 
 def _first_existing_path(candidates: list[str]) -> str | None:
     seen = set()
     for p in candidates:
         if not p:
             continue
-        try:
-            pp = os.path.abspath(_normalize_fs_path(str(p)))
-        except Exception:
-            pp = _normalize_fs_path(str(p))
-        key = os.path.normcase(pp)
+        p = str(p); key = _path_key(p)
         if key in seen:
             continue
         seen.add(key)
-        if os.path.isfile(pp):
+        try:
+            pp = os.path.abspath(_normalize_fs_path(p))
+        except Exception:
+            pp = _normalize_fs_path(p)
+        try:
+            st = os.stat(pp)
+        except OSError:
+            continue
+        if stat.S_ISREG(st.st_mode):
             return pp
     return None
 
+_GIT_TOOLS_CACHE = None
+_GIT_TOOLS_STAMP = 0.0
+_GIT_TOOLS_MISS_TTL = 60.0
+
 def _discover_git_for_windows_tools() -> tuple[str | None, str | None]:
+    global _GIT_TOOLS_CACHE, _GIT_TOOLS_STAMP
+    hit = _GIT_TOOLS_CACHE
+    if hit is not None and (any(hit) or time.monotonic() - _GIT_TOOLS_STAMP < _GIT_TOOLS_MISS_TTL):
+        return hit
+    _GIT_TOOLS_CACHE = _scan_git_for_windows_tools(); _GIT_TOOLS_STAMP = time.monotonic()
+    return _GIT_TOOLS_CACHE
+
+def _scan_git_for_windows_tools() -> tuple[str | None, str | None]:
     git_bash_candidates = []
     bash_candidates = []
 
@@ -1856,13 +2219,15 @@ def _launch_git_bash_here(owner_hwnd, work_dir: str, paths=None) -> bool:
     return False
 
 def _invoke_menu(owner_hwnd, cm, hmenu, screen_pt, work_dir, paths=None, id_first=1, id_last=None):
-    shown=False
+    shown=False; hwnd=int(owner_hwnd)
     try:
-        win32gui.SetForegroundWindow(owner_hwnd)
+        # TrackPopupMenu needs the owner in the foreground to dismiss properly; skip the request when it already is.
+        if win32gui.GetForegroundWindow() != hwnd:
+            win32gui.SetForegroundWindow(hwnd)
     except Exception: pass
     try:
         cmd_id = win32gui.TrackPopupMenu(hmenu, win32con.TPM_LEFTALIGN|win32con.TPM_RETURNCMD|win32con.TPM_RIGHTBUTTON,
-                                         int(screen_pt[0]), int(screen_pt[1]), 0, int(owner_hwnd), None)
+                                         int(screen_pt[0]), int(screen_pt[1]), 0, hwnd, None)
         shown=True
     except Exception as e:
         if DEBUG: print("[ctx] TrackPopupMenu failed:", e)
@@ -1879,11 +2244,12 @@ def _invoke_menu(owner_hwnd, cm, hmenu, screen_pt, work_dir, paths=None, id_firs
     except Exception:
         pass
 
-    if id_last is not None and (int(cmd_id) < int(id_first) or int(cmd_id) > int(id_last)):
+    cmd_id=int(cmd_id); id_first=int(id_first)
+    if id_last is not None and not (id_first <= cmd_id <= int(id_last)):
         if DEBUG: print(f"[ctx] cmd_id={cmd_id} out of range [{id_first}, {id_last}]")
         return False
 
-    idx=int(cmd_id)-int(id_first); verb=None
+    idx=cmd_id-id_first; verb=None
     try:
         verb = _get_canonical_verb(cm, idx) or None
     except Exception: verb=None
@@ -1939,12 +2305,8 @@ def _invoke_menu(owner_hwnd, cm, hmenu, screen_pt, work_dir, paths=None, id_firs
             if not ok:
                 try:
                     SHOP_FILEPATH = 0x00000002
-                    shell32 = ctypes.windll.shell32
-                    res = shell32.SHObjectProperties(ctypes.c_void_p(int(owner_hwnd)),
-                                                     ctypes.c_uint(SHOP_FILEPATH),
-                                                     ctypes.c_wchar_p(target),
-                                                     ctypes.c_wchar_p(None))
-                    ok = bool(res)
+                    if _SH_OBJECT_PROPERTIES is not None:
+                        ok = bool(_SH_OBJECT_PROPERTIES(int(owner_hwnd), SHOP_FILEPATH, target, None))
                 except Exception as e:
                     if DEBUG: print("[ctx] SHObjectProperties(ctypes) failed:", e)
 
@@ -1992,11 +2354,16 @@ def show_explorer_context_menu(owner_hwnd, paths, screen_pt):
         parent_dir = _normalize_fs_path(os.path.dirname(norm_paths[0]) or os.getcwd())
         app=QApplication.instance(); evf=_ensure_event_filter(app)
 
-        cm=_icm_via_shellitems(norm_paths)
+        abs_pidls = None
+        if len(norm_paths) > 1:
+            try: abs_pidls = tuple(_abs_pidl(p) for p in norm_paths)
+            except Exception as e:
+                if DEBUG: print("[ctx] SHParseDisplayName failed:", e)
+
+        cm=_icm_via_shellitems(norm_paths, abs_pidls) if len(norm_paths) <= SHELL_MENU_MAX else None
         if cm:
             evf.set_context(cm); hMenu=win32gui.CreatePopupMenu()
-            flags=shellcon.CMF_NORMAL|shellcon.CMF_EXPLORE|shellcon.CMF_INCLUDESTATIC
-            if win32api.GetKeyState(win32con.VK_SHIFT)<0: flags|=shellcon.CMF_EXTENDEDVERBS
+            flags=_ctx_menu_flags()
             id_first=1
             try:
                 id_last = _query_ctx_menu_id_last(cm, hMenu, id_first, flags)
@@ -2009,15 +2376,14 @@ def show_explorer_context_menu(owner_hwnd, paths, screen_pt):
 
         try:
             desktop=shell.SHGetDesktopFolder()
-            abs_pidls=tuple(_abs_pidl(p) for p in norm_paths)
+            if abs_pidls is None: abs_pidls=tuple(_abs_pidl(p) for p in norm_paths)
             cm=desktop.GetUIObjectOf(0,abs_pidls,shell.IID_IContextMenu,0); cm=_as_interface(cm)
         except Exception as e:
             if DEBUG: print("[ctx] desktop GetUIObjectOf failed:", e); cm=None
         if not cm: return False
 
         evf.set_context(cm); hMenu=win32gui.CreatePopupMenu()
-        flags=shellcon.CMF_NORMAL|shellcon.CMF_EXPLORE|shellcon.CMF_INCLUDESTATIC
-        if win32api.GetKeyState(win32con.VK_SHIFT)<0: flags|=shellcon.CMF_EXTENDEDVERBS
+        flags=_ctx_menu_flags()
         id_first=1
         id_last = _query_ctx_menu_id_last(cm, hMenu, id_first, flags)
         ok = _invoke_menu(owner_hwnd,cm,hMenu,screen_pt,parent_dir,paths=norm_paths,id_first=id_first,id_last=id_last)
@@ -2025,18 +2391,33 @@ def show_explorer_context_menu(owner_hwnd, paths, screen_pt):
     finally:
         pythoncom.CoUninitialize()
 
+# Parsed folder PIDLs (plain pywin32 data, no COM references) so each right-click re-binds without re-parsing.
+_BG_MENU_CACHE: dict[str, tuple[float, object]] = {}
+BG_MENU_REUSE_SEC = 2.0
+BG_MENU_EVICT_SEC = 10.0
+
+def _bg_menu_folder(folder_path):
+    # Reuse the parsed PIDL for quick repeated right-clicks on the same folder background; the IShellFolder
+    # is bound fresh each time so no COM object outlives this thread's CoUninitialize.
+    now = time.monotonic(); key = _path_key(folder_path)
+    for k in [k for k, (ts, _pidl) in _BG_MENU_CACHE.items() if now - ts > BG_MENU_EVICT_SEC]:
+        _BG_MENU_CACHE.pop(k, None)
+    hit = _BG_MENU_CACHE.get(key)
+    pidl = hit[1] if hit and now - hit[0] < BG_MENU_REUSE_SEC else _abs_pidl(folder_path)
+    _BG_MENU_CACHE[key] = (now, pidl)
+    return shell.SHGetDesktopFolder().BindToObject(pidl, None, shell.IID_IShellFolder)
+
 def show_explorer_background_menu(owner_hwnd, folder_path, screen_pt):
     if not HAS_PYWIN32: return False
     pythoncom.CoInitialize()
     try:
-        sf=_bind_folder(folder_path)
+        sf=_bg_menu_folder(folder_path)
         try: cm=sf.CreateViewObject(0, shell.IID_IContextMenu); cm=_as_interface(cm)
         except Exception: cm=None
         if not cm: return False
         app=QApplication.instance(); evf=_ensure_event_filter(app); evf.set_context(cm)
         hMenu=win32gui.CreatePopupMenu()
-        flags=shellcon.CMF_NORMAL|shellcon.CMF_EXPLORE|shellcon.CMF_INCLUDESTATIC
-        if win32api.GetKeyState(win32con.VK_SHIFT)<0: flags|=shellcon.CMF_EXTENDEDVERBS
+        flags=_ctx_menu_flags()
         id_first=1
         id_last = _query_ctx_menu_id_last(cm, hMenu, id_first, flags)
         ok = _invoke_menu(owner_hwnd,cm,hMenu,screen_pt,folder_path,paths=[folder_path],id_first=id_first,id_last=id_last)
@@ -2051,7 +2432,16 @@ try:
 except Exception:
     HAS_WINREG = False
 
+_SHELLNEW_CACHE: dict[str, tuple[bool, str | None]] = {}
+
 def _shellnew_template_for_ext(ext_with_dot: str) -> tuple[bool, str | None]:
+    key = ext_with_dot.lower()
+    hit = _SHELLNEW_CACHE.get(key)
+    if hit is None:
+        hit = _SHELLNEW_CACHE[key] = _lookup_shellnew_template(ext_with_dot)
+    return hit
+
+def _lookup_shellnew_template(ext_with_dot: str) -> tuple[bool, str | None]:
     if not HAS_WINREG:
         return (False, None)
     try:
@@ -2096,6 +2486,51 @@ def _create_new_file_with_template(dst_dir: str, filename: str, ext_with_dot: st
             pass
     return target
 
+_PENDING_SETTINGS = {}
+_SETTINGS_FLUSH_TIMER = None
+# Every pane's saved sort keys, read with one QSettings scan on first use and kept current by _queue_setting.
+_SORT_SETTINGS = None
+_SORT_SETTING_SUFFIXES = ("/sort_column", "/sort_order")
+
+def _flush_pending_settings(sync: bool = False):
+    if _PENDING_SETTINGS:
+        s = QSettings(ORG_NAME, APP_NAME)
+        for k, v in _PENDING_SETTINGS.items():
+            s.setValue(k, v)
+        _PENDING_SETTINGS.clear()
+        if sync:
+            s.sync()
+    elif sync:
+        QSettings(ORG_NAME, APP_NAME).sync()
+
+def _queue_setting(key: str, value):
+    global _SETTINGS_FLUSH_TIMER
+    _PENDING_SETTINGS[key] = value
+    if _SORT_SETTINGS is not None and key.endswith(_SORT_SETTING_SUFFIXES):
+        _SORT_SETTINGS[key] = value
+    if _SETTINGS_FLUSH_TIMER is None:
+        t = QTimer(); t.setSingleShot(True); t.setInterval(1000)
+        t.timeout.connect(lambda: _flush_pending_settings())
+        _SETTINGS_FLUSH_TIMER = t
+    _SETTINGS_FLUSH_TIMER.start()
+
+def _setting_value(key: str, default=None):
+    if key in _PENDING_SETTINGS:
+        return _PENDING_SETTINGS[key]
+    return QSettings(ORG_NAME, APP_NAME).value(key, default)
+
+def _sort_setting(key: str, default=None):
+    global _SORT_SETTINGS
+    if key in _PENDING_SETTINGS:
+        return _PENDING_SETTINGS[key]
+    if _SORT_SETTINGS is None:
+        s = QSettings(ORG_NAME, APP_NAME)
+        _SORT_SETTINGS = {k: s.value(k) for k in s.allKeys() if k.endswith(_SORT_SETTING_SUFFIXES)}
+    return _SORT_SETTINGS.get(key, default)
+
+def save_pane_path(i: int, path: str):
+    _queue_setting(f"layout/pane_{i}_path", path)
+
 def load_recent_path_history() -> list[str]:
     s = QSettings(ORG_NAME, APP_NAME)
     val = s.value("pathbar/recent_paths", [])
@@ -2176,6 +2611,21 @@ def file_extension_label(name_or_path: str, is_dir: bool = False) -> str:
     except Exception:
         return ""
 
+_EXT_LABELS: dict[str, str] = {}
+_EXT_LABELS_MAX = 4096
+
+def _name_extension(name: str) -> str:
+    # file_extension_label for a bare entry name, without basename/splitext; leading dots do not start an extension.
+    # Labels are shared through _EXT_LABELS so thousands of ".JPG" rows reuse one "jpg" string.
+    head, _, tail = name.rpartition(".")
+    if not tail or not head.strip("."):
+        return ""
+    label = _EXT_LABELS.get(tail)
+    if label is None:
+        label = sys.intern(tail.lower())
+        if len(_EXT_LABELS) < _EXT_LABELS_MAX: _EXT_LABELS[tail] = label
+    return label
+
 def migrate_legacy_favorites_into_named(items: list) -> list:
     try:
         s = QSettings(ORG_NAME, APP_NAME)
@@ -2194,60 +2644,92 @@ def migrate_legacy_favorites_into_named(items: list) -> list:
 
 IS_DIR_ROLE = Qt.UserRole + 99
 SIZE_BYTES_ROLE = Qt.UserRole + 100
-SEARCH_ICON_READY_ROLE = Qt.UserRole + 101
+# Extensions whose shell icon is embedded in or pointed to by the file itself.
+_PER_FILE_ICON_EXTS = frozenset(("exe", "lnk", "ico", "url", "cur", "ani", "scr", "msc", "cpl", "appref-ms"))
 NAME_FOLD_ROLE = Qt.UserRole + 102
 
 class FsSortProxy(QSortFilterProxyModel):
     def __init__(self, parent=None):
         super().__init__(parent)
+        self._src = None; self._rank_cache = None; self._rank_build_ok = False
         self.setDynamicSortFilter(True)
         self.setSortCaseSensitivity(Qt.CaseInsensitive)
         self.setSortRole(Qt.EditRole)
         self.setSortLocaleAware(False)
-    def _same_model(self, a, b) -> bool:
-        if a is None or b is None:
-            return False
-        if a is b:
-            return True
-        try:
-            return bool(a == b)
-        except Exception:
-            return False
+    def setSourceModel(self, model):
+        self._src = model
+        super().setSourceModel(model)
     def mapToSource(self, proxyIndex):
-        if not proxyIndex.isValid():
-            return QtCore.QModelIndex()
-        try:
-            if not self._same_model(proxyIndex.model(), self):
-                return QtCore.QModelIndex()
-        except Exception:
+        if not proxyIndex.isValid() or proxyIndex.model() is not self:
             return QtCore.QModelIndex()
         return super().mapToSource(proxyIndex)
     def mapFromSource(self, sourceIndex):
-        if not sourceIndex.isValid():
-            return QtCore.QModelIndex()
-        src = self.sourceModel()
-        if src is None:
-            return QtCore.QModelIndex()
-        try:
-            if not self._same_model(sourceIndex.model(), src):
-                return QtCore.QModelIndex()
-        except Exception:
+        src = self._src
+        if src is None or not sourceIndex.isValid() or sourceIndex.model() is not src:
             return QtCore.QModelIndex()
         return super().mapFromSource(sourceIndex)
     def filterAcceptsRow(self, source_row, source_parent): return True
     def sort(self, column, order=Qt.AscendingOrder):
 
         self._sort_order = order
-        super().sort(column, order)
+        # Only a full sort may (re)build the rank; dynamic re-sorts after each appended/statted batch compare raw keys.
+        self._rank_build_ok = True
+        try:
+            super().sort(column, order)
+        finally:
+            self._rank_build_ok = False
     def headerData(self, section, orientation, role=Qt.DisplayRole):
         if orientation == Qt.Horizontal and role == Qt.TextAlignmentRole:
             if section == 1:
                 return int(Qt.AlignRight | Qt.AlignVCenter)
             return int(Qt.AlignLeft | Qt.AlignVCenter)
         return super().headerData(section, orientation, role)
+    def _fast_less_than(self, src, col, lr, rr):
+        # Direct column-array reads; mirrors the role-based comparisons below without model dispatch.
+        ld = src._is_dirs[lr]; rd = src._is_dirs[rr]
+        if ld != rd:
+            return ld if getattr(self, "_sort_order", Qt.AscendingOrder) == Qt.AscendingOrder else rd
+        if col == 0:
+            return src._name_fold_at(lr) < src._name_fold_at(rr)
+        if col == 2:
+            return src._exts[lr] < src._exts[rr]  # labels are stored lowercased
+        if col == 4:
+            return src._folder_fold_at(lr) < src._folder_fold_at(rr)
+        if col == 1 and ld:
+            return False
+        rank = self._fast_rank(src, col)
+        if rank is None:
+            if col == 1:
+                ls = src._sizes[lr]; rs = src._sizes[rr]
+                return (ls if ls > 0 else 0) < (rs if rs > 0 else 0)
+            lm = src._mtimes[lr]; rm = src._mtimes[rr]
+            return (lm if lm == lm and lm else -math.inf) < (rm if rm == rm and rm else -math.inf)
+        return rank[lr] < rank[rr]
+    def _fast_rank(self, src, col):
+        # Dense rank of every source row by size (col 1) or mtime (col 3), built with one C-level sort and
+        # reused until the model's rows or stats change; lessThan then compares two ints.
+        # A stale rank is rebuilt only inside sort(); otherwise None is returned and callers compare keys directly.
+        cached = self._rank_cache
+        if cached is not None and cached[0] == col and cached[1] == src._gen:
+            return cached[2]
+        if not self._rank_build_ok:
+            return None
+        if col == 1:
+            keys = [s if s > 0 else 0 for s in src._sizes]
+        else:
+            keys = [m if m == m and m else -math.inf for m in src._mtimes]
+        rank = array("l", [0]) * len(keys)
+        prev = None; r = -1
+        for i in sorted(range(len(keys)), key=keys.__getitem__):
+            k = keys[i]
+            if k != prev: r += 1; prev = k
+            rank[i] = r
+        self._rank_cache = (col, src._gen, rank)
+        return rank
     def lessThan(self, left, right):
         col = left.column(); src = self.sourceModel()
-
+        if isinstance(src, FastDirModel):
+            return self._fast_less_than(src, col, left.row(), right.row())
 
         try:
             ldir = bool(src.isDir(left)) if hasattr(src, "isDir") else bool(src.data(left, IS_DIR_ROLE))
@@ -2276,7 +2758,7 @@ class FsSortProxy(QSortFilterProxyModel):
                 lv = src.data(left, NAME_FOLD_ROLE)
                 rv = src.data(right, NAME_FOLD_ROLE)
                 if lv is not None and rv is not None:
-                    return str(lv) < str(rv)
+                    return lv < rv
             except Exception:
                 pass
 
@@ -2292,47 +2774,97 @@ class FsSortProxy(QSortFilterProxyModel):
             return super().lessThan(left, right)
 
 
+_STD_FILE_ICON = None
+_STD_DIR_ICON = None
+def _std_icons():
+    global _STD_FILE_ICON, _STD_DIR_ICON
+    if _STD_FILE_ICON is None:
+        st = QApplication.instance().style() if QApplication.instance() else None
+        _STD_FILE_ICON = st.standardIcon(QStyle.SP_FileIcon) if st else QIcon()
+        _STD_DIR_ICON = st.standardIcon(QStyle.SP_DirIcon) if st else QIcon()
+    return _STD_FILE_ICON, _STD_DIR_ICON
+
+_NO_SIZE = -1
+_NO_MTIME = float("nan")
+
 class FastDirModel(QAbstractTableModel):
     HEADERS = ["Name", "Size", "Ext", "Date Modified"]
     def __init__(self, parent=None):
-        super().__init__(parent); self._root=""; self._rows=[]
-
-        self._icon_cache = {}
-        self._icon_file = None
-        self._icon_dir  = None
+        super().__init__(parent); self._root=""; self._prefix=""; self._gen=0
+        self._clear_rows()
+        self._build_dispatch()
+    def _clear_rows(self):
+        # Column-wise row storage; sizes/mtimes are unboxed with -1 / NaN meaning "not statted yet".
+        # Full paths are not stored: every row lives directly under the root, so they are rebuilt as _prefix + name.
+        self._names=[]; self._name_fold=[]; self._is_dirs=[]; self._exts=[]
+        self._sizes=array("q"); self._mtimes=array("d")
+        self._size_str=[]; self._date_str=[]
+        self._row_of={}
+        self._icon_cache = []
+        self._gen += 1
     def rootPath(self): return self._root
     def reset_dir(self, path:str):
-        self.beginResetModel(); self._root=path; self._rows=[]; self._icon_cache.clear(); self.endResetModel()
+        self.beginResetModel(); self._root=path; self._prefix=(path if path[-1:] in tuple(_SEPS) else path + os.sep) if path else ""
+        self._clear_rows(); self.endResetModel()
     @QtCore.pyqtSlot(list)
-    def append_rows(self, rows:list):
-        if not rows: return
-        start=len(self._rows); self.beginInsertRows(QtCore.QModelIndex(), start, start+len(rows)-1)
-        self._rows.extend(rows); self.endInsertRows()
-    def row_path(self, row:int)->str: return self._rows[row]["path"] if 0<=row<len(self._rows) else ""
+    def append_rows(self, cols:list):
+        # cols: [names, is_dirs, exts, sizes array('q'), mtimes array('d')] as built by DirEnumWorker.
+        if not cols or not cols[0]: return
+        names, is_dirs, exts, sizes, mtimes = cols; n=len(names)
+        start=len(self._names); self.beginInsertRows(QtCore.QModelIndex(), start, start+n-1)
+        self._names.extend(names)
+        self._index_rows(start, names)
+        self._is_dirs.extend(is_dirs); self._exts.extend(exts)
+        self._sizes.extend(sizes); self._mtimes.extend(mtimes)
+        pad=[None]*n; self._name_fold.extend(pad); self._size_str.extend(pad); self._date_str.extend(pad)
+        self._icon_cache.extend(pad); self._gen += 1; self.endInsertRows()
+    def _index_rows(self, start:int, names:list):
+        self._row_of.update(zip(map(os.path.normcase, names), range(start, start+len(names))))
+    def row_path(self, row:int)->str: return self._prefix + self._names[row] if 0<=row<len(self._names) else ""
+    def row_for_path(self, path:str)->int:
+        if not path: return -1
+        head, name = os.path.split(path)
+        if _path_key(head) != _path_key(self._root): return -1
+        return self._row_of.get(os.path.normcase(name), -1)
+    def row_name(self, row:int)->str: return self._names[row] if 0<=row<len(self._names) else ""
+    def row_is_dir(self, row:int)->bool: return 0<=row<len(self._is_dirs) and self._is_dirs[row]
     def has_stat(self, row:int)->bool:
-        if 0<=row<len(self._rows):
-            return (self._rows[row]["size"] is not None) and (self._rows[row]["mtime"] is not None)
+        if 0<=row<len(self._names):
+            m = self._mtimes[row]
+            return self._sizes[row] != _NO_SIZE and m == m
         return False
     def has_icon(self, row:int)->bool:
-        return row in self._icon_cache
-    @QtCore.pyqtSlot(int, object, object)
-    def apply_stat(self, row:int, size_val, mtime_val):
-        if not (0<=row<len(self._rows)): return
-        changed=[]
-        if self._rows[row]["size"] is None and size_val is not None:
-            self._rows[row]["size"]=int(size_val); changed.append(1)
-        if self._rows[row]["mtime"] is None and mtime_val is not None:
-            self._rows[row]["mtime"]=float(mtime_val); changed.append(3)
-        if changed:
-            for col in changed:
-                ix=self.index(row,col); self.dataChanged.emit(ix,ix,[Qt.DisplayRole,Qt.EditRole,SIZE_BYTES_ROLE])
+        return 0 <= row < len(self._icon_cache) and self._icon_cache[row] is not None
+    @QtCore.pyqtSlot(list)
+    def apply_stats_bulk(self, batch:list):
+        n=len(self._names); touched=[]
+        # Entries are (row, size, mtime, date text) with the text preformatted by the stat worker.
+        for row, size_val, mtime_val, date_txt in batch:
+            if not (0<=row<n): continue
+            hit=False
+            if self._sizes[row] == _NO_SIZE and size_val is not None:
+                self._sizes[row]=int(size_val); self._size_str[row]=None; hit=True
+            m = self._mtimes[row]
+            if m != m and mtime_val is not None:
+                self._mtimes[row]=float(mtime_val); self._date_str[row]=date_txt; hit=True
+            if hit: touched.append(row)
+        if not touched: return
+        self._gen += 1
+        # One dataChanged per contiguous run of rows instead of one per cell.
+        touched.sort(); roles=[Qt.DisplayRole,Qt.EditRole,SIZE_BYTES_ROLE]
+        start=prev=touched[0]
+        for row in touched[1:]:
+            if row != prev+1:
+                self.dataChanged.emit(self.index(start,1), self.index(prev,3), roles); start=row
+            prev=row
+        self.dataChanged.emit(self.index(start,1), self.index(prev,3), roles)
     def apply_icon(self, row:int, icon:QIcon):
-        if 0 <= row < len(self._rows):
+        if 0 <= row < len(self._names):
             self._icon_cache[row] = icon
             ix = self.index(row, 0)
             self.dataChanged.emit(ix, ix, [Qt.DecorationRole])
-    def rowCount(self, parent=QtCore.QModelIndex()): return 0 if parent.isValid() else len(self._rows)
-    def columnCount(self, parent=QtCore.QModelIndex()): return 4
+    def rowCount(self, parent=QtCore.QModelIndex()): return 0 if parent.isValid() else len(self._names)
+    def columnCount(self, parent=QtCore.QModelIndex()): return 0 if parent.isValid() else len(self.HEADERS)
     def headerData(self, section, orientation, role=Qt.DisplayRole):
         return self.HEADERS[section] if role==Qt.DisplayRole and orientation==Qt.Horizontal else None
     def flags(self, index):
@@ -2346,106 +2878,136 @@ class FastDirModel(QAbstractTableModel):
         md = QtCore.QMimeData()
         if not indexes:
             return md
+        # This is what the view's drag uses for both browse and search rows. Paths come straight from the
+        # row arrays with no per-path existence check; one removed since listing is reported by the drop target.
         rows = sorted({ix.row() for ix in indexes if ix.isValid()})
-        urls = []
-        paths = []
-        for row in rows:
-            p = self.row_path(row)
-            if not p:
-                continue
-            paths.append(p)
-            urls.append(QUrl.fromLocalFile(p))
-        if urls:
-            md.setUrls(urls)
+        paths = [p for p in map(self.row_path, rows) if p]
+        if paths:
+            md.setUrls(list(map(QUrl.fromLocalFile, paths)))
             md.setText("\r\n".join(paths))
         return md
     def supportedDragActions(self):
         return Qt.CopyAction | Qt.MoveAction
+    def _build_dispatch(self):
+        # (role, column) -> row getter, built once; data() is then one dict lookup and one call per cell.
+        d = {}
+        for c in range(len(self.HEADERS)):
+            d[(Qt.ToolTipRole, c)] = d[(Qt.UserRole, c)] = self.row_path
+            d[(IS_DIR_ROLE, c)] = self._is_dir_at
+            d[(SIZE_BYTES_ROLE, c)] = self._size_at
+        for c in (1, 2, 3):
+            d[(Qt.TextAlignmentRole, c)] = self._align_right
+        d[(Qt.DecorationRole, 0)] = self._icon_at
+        d[(Qt.DisplayRole, 0)] = d[(Qt.EditRole, 0)] = self._name_at
+        d[(Qt.DisplayRole, 1)] = self._size_text_at
+        d[(Qt.DisplayRole, 2)] = d[(Qt.EditRole, 2)] = self._ext_at
+        d[(Qt.DisplayRole, 3)] = self._date_text_at
+        d[(Qt.EditRole, 1)] = self._size_at
+        d[(Qt.EditRole, 3)] = self._date_at
+        d[(NAME_FOLD_ROLE, 0)] = self._name_fold_at
+        self._dispatch = d
+    @staticmethod
+    def _align_right(_row): return int(Qt.AlignRight | Qt.AlignVCenter)
+    def _icon_at(self, row):
+        ic = self._icon_cache[row]
+        if ic is not None:
+            return ic
+        if _STD_FILE_ICON is None:
+            try: _std_icons()
+            except Exception: return None
+        return _STD_DIR_ICON if self._is_dirs[row] else _STD_FILE_ICON
+    def _name_at(self, row): return self._names[row]
+    def _name_fold_at(self, row):
+        # Casefolded names are only needed by the name sort, so they are built on first read.
+        nf = self._name_fold[row]
+        if nf is None:
+            nf = self._name_fold[row] = self._names[row].casefold()
+        return nf
+    def _ext_at(self, row): return self._exts[row]
+    def _is_dir_at(self, row): return self._is_dirs[row]
+    def _size_at(self, row):
+        if self._is_dirs[row]: return 0
+        size=self._sizes[row]
+        return 0 if size == _NO_SIZE else size
+    def _size_text_at(self, row):
+        txt=self._size_str[row]
+        if txt is None:
+            size=self._sizes[row]
+            txt=self._size_str[row]="" if (self._is_dirs[row] or size == _NO_SIZE) else human_size(size)
+        return txt
+    def _date_at(self, row):
+        m=self._mtimes[row]
+        return QDateTime.fromSecsSinceEpoch(int(m)) if (m == m and m) else QDateTime()
+    def _date_text_at(self, row):
+        txt=self._date_str[row]
+        if txt is None:
+            m=self._mtimes[row]
+            txt=self._date_str[row]=_format_mtime(m)
+        return txt
     def data(self, index, role=Qt.DisplayRole):
-        if not index.isValid(): return None
-        r=self._rows[index.row()]; c=index.column()
-
-        if role == Qt.TextAlignmentRole:
-            if c in (1, 2, 3):
-                return int(Qt.AlignRight | Qt.AlignVCenter)
+        h = self._dispatch.get((role, index.column()))
+        return h(index.row()) if h is not None and index.isValid() else None
 
+def _format_mtime(m) -> str:
+    # Stat workers format dates on their own thread so the GUI-side slots only assign strings.
+    if m is None or m != m: return ""
+    try: return time.strftime(LIST_DATETIME_STRFTIME, time.localtime(m))
+    except (OverflowError, OSError, ValueError): return ""
 
-        if role == Qt.DecorationRole and c == 0:
-            ic = self._icon_cache.get(index.row())
-            if ic is not None:
-                return ic
-            try:
-                if self._icon_file is None or self._icon_dir is None:
-                    st = QApplication.instance().style()
-                    self._icon_file = st.standardIcon(QStyle.SP_FileIcon) if st else QIcon()
-                    self._icon_dir  = st.standardIcon(QStyle.SP_DirIcon)  if st else QIcon()
-            except Exception:
-                return None
-            return self._icon_dir if r["is_dir"] else self._icon_file
-
-        if role==Qt.DisplayRole:
-            if c==0:
-                return r["name"]
-            if c==1:
-
-                if r.get("is_dir", False): return ""
-                if r["size"] is None: return ""
-                return human_size(int(r["size"]))
-            if c==2:
-                return r.get("ext", "")
-            if c==3:
-                if r["mtime"] is None: return ""
-                dt=QDateTime.fromSecsSinceEpoch(int(r["mtime"])); return dt.toString(LIST_DATETIME_FMT)
-
-        elif role==Qt.EditRole:
-            if c==0: return r["name"]
-            if c==1:
-
-                if r.get("is_dir", False): return 0
-                return 0 if r["size"] is None else int(r["size"])
-            if c==2:
-                return r.get("ext", "")
-            if c==3:
-                return QDateTime.fromSecsSinceEpoch(int(r["mtime"])) if r["mtime"] else QDateTime()
-            return ""
+_STAT_DIR_FD = os.stat in os.supports_dir_fd and hasattr(os, "O_DIRECTORY")
 
-        elif role==Qt.ToolTipRole:
-            return r["path"]
-        elif role==Qt.UserRole:
-            return r["path"]
-        elif role==IS_DIR_ROLE:
-            return r["is_dir"]
-        elif role==SIZE_BYTES_ROLE:
-
-            if r.get("is_dir", False): return 0
-            return 0 if r["size"] is None else int(r["size"])
-        elif role==NAME_FOLD_ROLE and c==0:
-            return r.get("name_l") or str(r.get("name", "")).lower()
-
-        return None
+def _stat_size_mtime(p: str, dir_fd=None, known_dir=False):
+    # One lstat per entry; only symlinks pay for a second (following) stat to detect linked dirs.
+    # With dir_fd, p is a bare name resolved via fstatat relative to the already-open directory.
+    # known_dir: the caller already knows p is a directory, so its size is 0 and no mode check is needed.
+    try:
+        st=os.lstat(p, dir_fd=dir_fd) if dir_fd is not None else os.lstat(p); mode=st.st_mode
+        if known_dir:
+            is_dir=True
+        elif stat.S_ISLNK(mode):
+            try: is_dir=stat.S_ISDIR((os.stat(p, dir_fd=dir_fd) if dir_fd is not None else os.stat(p)).st_mode)
+            except OSError: is_dir=False
+        else:
+            is_dir=stat.S_ISDIR(mode)
+        return (0 if is_dir else int(st.st_size)), float(st.st_mtime)
+    except Exception:
+        return 0, None
 
 class FastStatWorker(QtCore.QThread):
-    statReady=pyqtSignal(int, object, object); finishedCycle=pyqtSignal()
+    statsReady=pyqtSignal(list); finishedCycle=pyqtSignal()
+    BATCH=256; FLUSH_SEC=0.1
     def __init__(self, model:FastDirModel, root:str, rows:list[int], parent=None):
         super().__init__(parent); self._model=model; self._root=root; self._rows=list(rows); self._cancel=False
     def cancel(self): self._cancel=True
     def run(self):
+        batch=[]; last=time.monotonic(); dir_fd=None; model=self._model
+        if _STAT_DIR_FD:
+            try: dir_fd=os.open(self._root, os.O_RDONLY | os.O_DIRECTORY)
+            except OSError: dir_fd=None
         try:
             for row in self._rows:
                 if self._cancel: break
-                if self._model.rootPath()!=self._root: break
-                if self._model.has_stat(row): continue
-                p=self._model.row_path(row)
-                try:
-                    st=os.stat(p, follow_symlinks=False)
-                    size_val=0 if os.path.isdir(p) else int(st.st_size)
-                    mtime_val=float(st.st_mtime)
-                except Exception:
-                    size_val=0; mtime_val=None
-                self.statReady.emit(row,size_val,mtime_val)
+                if model.rootPath()!=self._root: batch=[]; break
+                if model.has_stat(row): continue
+                # DirEnumWorker already recorded is_dir, so directories skip the link/mode probe entirely.
+                known_dir=model.row_is_dir(row)
+                if dir_fd is not None:
+                    size_val, mtime_val = _stat_size_mtime(model.row_name(row), dir_fd, known_dir)
+                else:
+                    size_val, mtime_val = _stat_size_mtime(model.row_path(row), None, known_dir)
+                batch.append((row,size_val,mtime_val,_format_mtime(mtime_val)))
+                if len(batch)>=self.BATCH or time.monotonic()-last>=self.FLUSH_SEC:
+                    self.statsReady.emit(batch); batch=[]; last=time.monotonic()
+            if batch and self._model.rootPath()==self._root: self.statsReady.emit(batch)
         finally:
+            if dir_fd is not None:
+                try: os.close(dir_fd)
+                except OSError: pass
             self.finishedCycle.emit()
 
+# On Windows DirEntry.stat() is served from the FindFirstFile/FindNextFile data, so enumeration can fill size/mtime for free.
+ENUM_STAT_FREE = os.name == "nt" and not _env_flag("MULTIPANE_LAZY_STAT")
+
 class DirEnumWorker(QtCore.QThread):
     batchReady=QtCore.pyqtSignal(list); finished=QtCore.pyqtSignal(); error=QtCore.pyqtSignal(str)
     def __init__(self, root:str, parent=None, preload_size: bool = False, preload_mtime: bool = False):
@@ -2455,65 +3017,85 @@ class DirEnumWorker(QtCore.QThread):
         self._preload_size = bool(preload_size)
         self._preload_mtime = bool(preload_mtime)
     def cancel(self): self._cancel=True
+    @staticmethod
+    def _new_batch():
+        return [[], [], [], array("q"), array("d")]
     def run(self):
-        batch, BATCH=[], 400
+        BATCH=400
+        eager = self._preload_size or self._preload_mtime or ENUM_STAT_FREE
+        batch=self._new_batch(); names, is_dirs, exts, sizes, mtimes = batch
+        emit=self.batchReady.emit; ext_of=_name_extension
         try:
             with os.scandir(self.root) as it:
                 for entry in it:
                     if self._cancel: break
-                    name=entry.name; p=os.path.join(self.root,name)
+                    name=entry.name
                     try: is_dir=entry.is_dir(follow_symlinks=False)
-                    except Exception: is_dir=os.path.isdir(p)
-                    ext = file_extension_label(name, is_dir)
-                    size_val = None
-                    mtime_val = None
-                    if self._preload_size or self._preload_mtime:
+                    except Exception: is_dir=os.path.isdir(entry.path)
+                    size_val = _NO_SIZE
+                    mtime_val = _NO_MTIME
+                    if eager:
+                        # The stat is paid for either way, so fill both columns and spare FastStatWorker a second pass.
                         try:
                             st = entry.stat(follow_symlinks=False)
-                            if self._preload_size:
-                                size_val = 0 if is_dir else int(st.st_size)
-                            if self._preload_mtime:
-                                mtime_val = float(st.st_mtime)
+                            size_val = 0 if is_dir else int(st.st_size)
+                            mtime_val = float(st.st_mtime)
                         except Exception:
-                            if self._preload_size:
-                                size_val = 0 if is_dir else None
-                            if self._preload_mtime:
-                                mtime_val = None
-                    batch.append({
-                        "name": name,
-                        "name_l": name.lower(),
-                        "path": p,
-                        "is_dir": is_dir,
-                        "ext": ext,
-                        "size": size_val,
-                        "mtime": mtime_val,
-                    })
-                    if len(batch)>=BATCH: self.batchReady.emit(batch); batch=[]
-                if batch: self.batchReady.emit(batch)
+                            if is_dir: size_val = 0
+                    names.append(name); is_dirs.append(is_dir)
+                    exts.append("" if is_dir else ext_of(name))
+                    sizes.append(size_val); mtimes.append(mtime_val)
+                    if len(names)>=BATCH:
+                        emit(batch)
+                        batch=self._new_batch(); names, is_dirs, exts, sizes, mtimes = batch
+                if names: emit(batch)
         except Exception as e:
             self.error.emit(str(e))
         finally:
             self.finished.emit()
 
 class NormalStatWorker(QtCore.QThread):
-    statReady=pyqtSignal(str, object, object); finishedCycle=pyqtSignal()
-    def __init__(self, paths:list[str], parent=None):
-        super().__init__(parent); self._paths=list(paths); self._cancel=False
+    statsReady=pyqtSignal(list); finishedCycle=pyqtSignal()
+    BATCH=64; FLUSH_SEC=0.1
+    def __init__(self, paths:list[str], parent=None, feed:deque|None=None):
+        super().__init__(parent); self._paths=list(paths); self._feed=feed; self._cancel=False
     def cancel(self): self._cancel=True
+    def _drain(self):
+        # A shared feed keeps one thread alive for as long as the owner keeps appending to it.
+        yield from self._paths
+        feed=self._feed
+        while feed:
+            try: yield feed.popleft()
+            except IndexError: return
     def run(self):
+        batch=[]; last=time.monotonic()
         try:
-            for p in self._paths:
+            for p in self._drain():
                 if self._cancel: break
-                try:
-                    st=os.stat(p, follow_symlinks=False)
-                    size_val=0 if os.path.isdir(p) else int(st.st_size)
-                    mtime_val=float(st.st_mtime)
-                except Exception:
-                    size_val=0; mtime_val=None
-                self.statReady.emit(p,size_val,mtime_val)
+                size_val, mtime_val = _stat_size_mtime(p)
+                batch.append((p,size_val,mtime_val,_format_mtime(mtime_val)))
+                if len(batch)>=self.BATCH or time.monotonic()-last>=self.FLUSH_SEC:
+                    self.statsReady.emit(batch); batch=[]; last=time.monotonic()
+            if batch: self.statsReady.emit(batch)
         finally:
             self.finishedCycle.emit()
 
+@lru_cache(maxsize=256)
+def _search_matchers(patterns: tuple):
+    # "*.ext" patterns collapse into one endswith tuple; every other glob joins a single compiled regex.
+    # Cached per pattern set, so re-running a search (refresh, re-typing the same filter) skips translate/compile.
+    exts = []; globs = []
+    for p in patterns:
+        simple_ext = (p.startswith("*.") and ("*" not in p[2:]) and ("?" not in p) and ("[" not in p) and ("]" not in p))
+        if simple_ext:
+            exts.append(p[1:])
+        else:
+            globs.append(fnmatch.translate(p))
+    # Names are matched as-is: the regex ignores case and the extension test lowers only the name's tail.
+    ext_tail = -max(map(len, exts)) if exts else 0
+    re_match = re.compile("|".join(globs), re.IGNORECASE).match if globs else None
+    return tuple(exts), ext_tail, re_match
+
 class SearchWorker(QtCore.QThread):
     batchReady = pyqtSignal(str, list)
     finished = pyqtSignal()
@@ -2531,76 +3113,115 @@ class SearchWorker(QtCore.QThread):
         raw = (pattern_str or "").replace(",", " ").replace(";", " ").split()
         self._patterns = [p.lower() for p in raw] if raw else ["*"]
 
-        self._tests = []
-        for p in self._patterns:
-            simple_ext = (p.startswith("*.") and ("*" not in p[2:]) and ("?" not in p) and ("[" not in p) and ("]" not in p))
-            if simple_ext:
-                ext = p[1:]
-                self._tests.append(lambda name, ext=ext: name.endswith(ext))
-            else:
-
-                self._tests.append(lambda name, pat=p: fnmatch.fnmatchcase(name, pat))
+        self._ext_tuple, self._ext_tail, self._re_match = _search_matchers(tuple(self._patterns))
+        # Trivial pattern sets skip the generic _match entirely.
+        if self._patterns == ["*"]:
+            self._match = lambda _name: True
+        elif self._re_match is None:
+            self._match = lambda name, t=self._ext_tuple, k=self._ext_tail: name[k:].lower().endswith(t)
 
     def cancel(self): self._cancel = True
 
-    def _match(self, name_lower: str) -> bool:
-        for t in self._tests:
-            if t(name_lower):
-                return True
-        return False
+    def _match(self, name: str) -> bool:
+        if self._ext_tuple and name[self._ext_tail:].lower().endswith(self._ext_tuple):
+            return True
+        return self._re_match is not None and self._re_match(name) is not None
 
-    def run(self):
+    def _scan_dir(self, d: str, base: str):
+        found = []; subdirs = []
+        # d is always base joined with child names, so the relative folder is a plain slice.
+        cut = len(base) if base[-1:] in tuple(_SEPS) else len(base) + 1
+        rel = d[cut:] if len(d) > cut else ""
+        match = self._match; add_found = found.append; add_subdir = subdirs.append
         try:
-            base = self.base
-            stack = [base]
-            BATCH = 600
-            batch = []
-            while stack and not self._cancel:
-                d = stack.pop()
-                try:
-                    with os.scandir(d) as it:
-                        for entry in it:
-                            if self._cancel:
-                                break
+            with os.scandir(d) as it:
+                for entry in it:
+                    if self._cancel:
+                        break
+                    try:
+                        is_dir = entry.is_dir(follow_symlinks=False)
+                    except Exception:
+                        is_dir = os.path.isdir(entry.path)
+
+                    name = entry.name
+                    if match(name):
+                        rec = {
+                            "name": name,
+                            "path": entry.path,
+                            "is_dir": is_dir,
+                            "folder": rel
+                        }
+                        # Where the enumeration already carries stat data, hand it over instead of re-statting later.
+                        if ENUM_STAT_FREE and not is_dir:
                             try:
-                                is_dir = entry.is_dir(follow_symlinks=False)
+                                if not entry.is_symlink():
+                                    st = entry.stat(follow_symlinks=False)
+                                    rec["size"] = int(st.st_size); rec["mtime"] = float(st.st_mtime)
                             except Exception:
-                                is_dir = os.path.isdir(entry.path)
-
-                            name_l = entry.name.lower()
-                            if self._match(name_l):
-                                if self._matches >= self._max_results:
-                                    self._truncated = True
-                                    self._cancel = True
-                                    break
-                                self._matches += 1
-                                rel = os.path.relpath(d, base)
-                                if rel == ".":
-                                    rel = ""
-                                batch.append({
-                                    "name": entry.name,
-                                    "path": entry.path,
-                                    "is_dir": is_dir,
-                                    "folder": rel
-                                })
-                                if len(batch) >= BATCH:
-                                    self.batchReady.emit(base, batch)
-                                    batch = []
-
-
-                            if is_dir:
-                                try:
-                                    if entry.is_symlink():
-                                        continue
-                                except Exception:
-                                    pass
-                                stack.append(entry.path)
-                except Exception:
+                                pass
+                        add_found(rec)
 
+                    if is_dir:
+                        try:
+                            if entry.is_symlink():
+                                continue
+                        except Exception:
+                            pass
+                        add_subdir(entry.path)
+        except Exception:
+            pass
+        return found, subdirs
+
+    def _walk_worker(self, base: str, q, state: dict):
+        BATCH = 600
+        batch = []
+        lock = state["lock"]
+        while True:
+            d = q.get()
+            if d is None:
+                break
+            try:
+                if self._cancel:
                     continue
+                found, subdirs = self._scan_dir(d, base)
+                with lock:
+                    room = self._max_results - self._matches
+                    if len(found) > room:
+                        found = found[:max(0, room)]
+                        self._truncated = True
+                        self._cancel = True
+                    self._matches += len(found)
+                    if not self._cancel:
+                        state["pending"] += len(subdirs)
+                        for sd in subdirs:
+                            q.put(sd)
+                if found:
+                    batch.extend(found)
+                    if len(batch) >= BATCH:
+                        self.batchReady.emit(base, batch)
+                        batch = []
+            finally:
+                with lock:
+                    state["pending"] -= 1
+                    done = state["pending"] == 0
+                if done:
+                    for _ in range(state["threads"]):
+                        q.put(None)
+        if batch:
+            self.batchReady.emit(base, batch)
 
-            if batch:
-                self.batchReady.emit(base, batch)
+    def run(self):
+        try:
+            base = self.base
+            q = queue.SimpleQueue(); q.put(base)
+            # Directories are independent scandir calls; a small pool overlaps their I/O latency.
+            state = {"lock": threading.Lock(), "pending": 1, "threads": SEARCH_WALK_THREADS}
+            threads = [threading.Thread(target=self._walk_worker, args=(base, q, state), daemon=True)
+                       for _ in range(SEARCH_WALK_THREADS)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
             if self._truncated:
                 self.truncated.emit(self._matches)
         except Exception as e:
@@ -2608,15 +3229,20 @@ class SearchWorker(QtCore.QThread):
         finally:
             self.finished.emit()
 
+STAT_OVERLAY_CACHE_MAX = 50000
+
 class StatOverlayProxy(QIdentityProxyModel):
     def __init__(self, parent=None):
         super().__init__(parent)
-        self._cache = {}
-        self._pending = set()
-        self._queue = []
+        self._cache = OrderedDict()  # oldest-stat-first; capped at STAT_OVERLAY_CACHE_MAX
+        self._queue = {}  # insertion-ordered: FIFO and membership test in one structure
+        self._inflight = frozenset()
         self._worker = None
         self._batch_limit = 256
         self._refresh_after_pending = set()
+        self._src = None
+        self._col_handlers = {1: self._data_size, 2: self._data_ext, 3: self._data_date}
+        self.sourceModelChanged.connect(self._on_source_changed)
 
     def filePath(self, index):
         src = self.sourceModel()
@@ -2636,8 +3262,8 @@ class StatOverlayProxy(QIdentityProxyModel):
 
     def clear_cache(self):
         self._cache.clear()
-        self._pending.clear()
         self._queue.clear()
+        self._inflight = frozenset()
         self._refresh_after_pending.clear()
         self._cancel_worker()
 
@@ -2653,109 +3279,69 @@ class StatOverlayProxy(QIdentityProxyModel):
             return "Ext"
         return super().headerData(section, orientation, role)
 
+    _SIZE_ROLES = frozenset((Qt.DisplayRole, Qt.EditRole, SIZE_BYTES_ROLE))
+    _TEXT_ROLES = frozenset((Qt.DisplayRole, Qt.EditRole))
+
+    def _on_source_changed(self):
+        self._src = self.sourceModel()
+
     def data(self, index, role=Qt.DisplayRole):
         if not index.isValid():
             return None
 
         col = index.column()
-        if col not in (1, 2, 3):
+        if col != 1 and col != 2 and col != 3:
             return super().data(index, role)
 
         if role == Qt.TextAlignmentRole:
             return int(Qt.AlignRight | Qt.AlignVCenter)
 
-        src = self.sourceModel()
-        sidx = self.mapToSource(index)
-
-        try:
-            p = src.filePath(sidx)
-        except Exception:
-            p = None
+        # Roles the overlay does not rewrite go straight to the source without resolving the path.
+        if role not in (self._SIZE_ROLES if col == 1 else self._TEXT_ROLES):
+            return super().data(index, role)
 
+        src = self._src
+        sidx = self.mapToSource(index)
+        p = src.filePath(sidx) or ""
         try:
             is_dir = src.isDir(sidx)
         except Exception:
-            try:
-                is_dir = os.path.isdir(p) if p else False
-            except Exception:
-                is_dir = False
+            is_dir = os.path.isdir(p) if p else False
+        return self._col_handlers[col](src, sidx, p, is_dir, role)
+
+    def _data_size(self, src, sidx, p, is_dir, role):
+        if is_dir:
+            return "" if role == Qt.DisplayRole else 0
 
         rec = self._cache.get(p) if p else None
+        if rec is not None:
+            size_val = int(rec[0] or 0)
+            return human_size(size_val) if role == Qt.DisplayRole else size_val
 
-        info = None
-        if rec is None and p:
+        if p:
             try:
-                info = src.fileInfo(sidx)
+                size_val = max(0, int(src.fileInfo(sidx).size()))
+                return human_size(size_val) if role == Qt.DisplayRole else size_val
             except Exception:
-                info = None
-
-        if col == 1:
-            if is_dir:
-                if role == SIZE_BYTES_ROLE:
-                    return 0
-                if role == Qt.EditRole:
-                    return 0
-                if role == Qt.DisplayRole:
-                    return ""
-                return super().data(index, role)
-
-            if rec is not None:
-                size_val = int(rec[0] or 0)
-                if role == SIZE_BYTES_ROLE:
-                    return size_val
-                if role == Qt.EditRole:
-                    return size_val
-                if role == Qt.DisplayRole:
-                    return human_size(size_val)
-
-            if info is not None:
-                try:
-                    size_val = max(0, int(info.size()))
-                    if role == SIZE_BYTES_ROLE:
-                        return size_val
-                    if role == Qt.EditRole:
-                        return size_val
-                    if role == Qt.DisplayRole:
-                        return human_size(size_val)
-                except Exception:
-                    pass
-
-            if role in (SIZE_BYTES_ROLE, Qt.EditRole):
-                return 0
-            if role == Qt.DisplayRole:
-                return ""
-            return super().data(index, role)
-
-        if col == 2:
-            ext = file_extension_label(p, is_dir)
-            if role in (Qt.DisplayRole, Qt.EditRole):
-                return ext
-            return super().data(index, role)
+                pass
+        return "" if role == Qt.DisplayRole else 0
 
-        if col == 3:
-            if rec and rec[1] is not None:
-                dt = QDateTime.fromSecsSinceEpoch(int(rec[1]))
-                if role == Qt.DisplayRole:
-                    return dt.toString(LIST_DATETIME_FMT)
-                if role == Qt.EditRole:
-                    return dt
+    def _data_ext(self, src, sidx, p, is_dir, role):
+        return file_extension_label(p, is_dir)
 
-            if info is not None:
-                try:
-                    dt = info.lastModified()
-                    if dt and dt.isValid():
-                        if role == Qt.DisplayRole:
-                            return dt.toString(LIST_DATETIME_FMT)
-                        if role == Qt.EditRole:
-                            return dt
-                except Exception:
-                    pass
+    def _data_date(self, src, sidx, p, is_dir, role):
+        rec = self._cache.get(p) if p else None
+        if rec and rec[1] is not None:
+            return rec[2] if role == Qt.DisplayRole else QDateTime.fromSecsSinceEpoch(int(rec[1]))
 
-            if role == Qt.DisplayRole:
-                return ""
-            if role == Qt.EditRole:
-                return QDateTime()
-            return super().data(index, role)
+        if rec is None and p:
+            try:
+                dt = src.fileInfo(sidx).lastModified()
+                if dt and dt.isValid():
+                    return dt.toString(LIST_DATETIME_FMT) if role == Qt.DisplayRole else dt
+            except Exception:
+                pass
+        return "" if role == Qt.DisplayRole else QDateTime()
 
     def request_paths(self, paths: list[str], batch_limit: int = 256, force: bool = False):
         try:
@@ -2764,20 +3350,22 @@ class StatOverlayProxy(QIdentityProxyModel):
             self._batch_limit = 256
 
         added = False
+        cache = self._cache; queue = self._queue; inflight = self._inflight
         for p in paths:
             if not p:
                 continue
             if force:
-                self._cache.pop(p, None)
-            elif p in self._cache:
+                cache.pop(p, None)
+            elif p in cache:
                 continue
 
-            if p in self._pending:
+            if p in inflight:
                 if force:
                     self._refresh_after_pending.add(p)
                 continue
-            self._pending.add(p)
-            self._queue.append(p)
+            if p in queue:
+                continue
+            queue[p] = None
             added = True
 
         if added:
@@ -2791,43 +3379,56 @@ class StatOverlayProxy(QIdentityProxyModel):
             return
 
         batch_size = max(1, int(self._batch_limit))
-        batch = self._queue[:batch_size]
-        del self._queue[:batch_size]
+        batch = list(itertools.islice(self._queue, batch_size))
+        for p in batch:
+            del self._queue[p]
+        self._inflight = frozenset(batch)
 
         w = NormalStatWorker(batch, self)
-        w.statReady.connect(self._apply_stat, Qt.QueuedConnection)
-        w.finishedCycle.connect(lambda b=batch: self._on_cycle_finished(b), Qt.QueuedConnection)
+        w.statsReady.connect(self._apply_stats, Qt.QueuedConnection)
+        w.finishedCycle.connect(lambda b=batch, w=w: self._on_cycle_finished(b, w), Qt.QueuedConnection)
         self._worker = w
         w.start()
 
-    @QtCore.pyqtSlot(str, object, object)
-    def _apply_stat(self, path: str, size_val, mtime_val):
-        self._cache[path] = (int(size_val or 0), float(mtime_val) if mtime_val is not None else None)
+    @QtCore.pyqtSlot(list)
+    def _apply_stats(self, batch: list):
+        groups = {}; cache = self._cache
         try:
             src = self.sourceModel()
-            sidx0 = src.index(path)
-            if sidx0.isValid():
-                for col in (1, 3):
-                    sidx = sidx0.sibling(sidx0.row(), col)
-                    pidx = self.mapFromSource(sidx)
-                    self.dataChanged.emit(pidx, pidx, [Qt.DisplayRole, Qt.EditRole, SIZE_BYTES_ROLE])
+            for path, size_val, mtime_val, dt_str in batch:
+                if mtime_val is not None:
+                    mtime_val = float(mtime_val)
+                cache[path] = (int(size_val or 0), mtime_val, dt_str); cache.move_to_end(path)
+                if len(cache) > STAT_OVERLAY_CACHE_MAX: cache.popitem(last=False)
+                sidx0 = src.index(path)
+                if sidx0.isValid():
+                    parent = sidx0.parent()
+                    groups.setdefault(os.path.dirname(path), (parent, []))[1].append(sidx0.row())
+            # One dataChanged over columns 1-3 per contiguous run of rows under the same parent.
+            roles = [Qt.DisplayRole, Qt.EditRole, SIZE_BYTES_ROLE]
+            for parent, rows in groups.values():
+                rows.sort(); start = prev = rows[0]
+                for row in rows[1:] + [None]:
+                    if row is not None and row <= prev + 1:
+                        prev = row; continue
+                    tl = self.mapFromSource(src.index(start, 1, parent)); br = self.mapFromSource(src.index(prev, 3, parent))
+                    self.dataChanged.emit(tl, br, roles)
+                    if row is not None: start = prev = row
         except Exception:
             pass
 
-    def _on_cycle_finished(self, batch):
-        retry = []
-        for p in batch:
-            self._pending.discard(p)
-            if p in self._refresh_after_pending:
-                self._refresh_after_pending.discard(p)
-                retry.append(p)
+    def _on_cycle_finished(self, batch, worker=None):
+        # A worker cancelled by clear_cache can report after its replacement started; its batch is no longer in flight.
+        if worker is not self._worker:
+            return
+        self._inflight = self._inflight.difference(batch)
         self._worker = None
-        for p in retry:
-            if p in self._pending:
-                continue
-            self._cache.pop(p, None)
-            self._pending.add(p)
-            self._queue.append(p)
+        if self._refresh_after_pending:
+            for p in batch:
+                if p in self._refresh_after_pending:
+                    self._refresh_after_pending.discard(p)
+                    self._cache.pop(p, None)
+                    self._queue[p] = None
         self._start_next_batch()
 
 class PathBar(QWidget):
@@ -2835,7 +3436,7 @@ class PathBar(QWidget):
     _shared_recent_paths: list[str] | None = None
 
     def __init__(self, parent=None):
-        super().__init__(parent); self._current_path=QDir.homePath()
+        super().__init__(parent); self._current_path=_home()
         self.setObjectName("pathbar")
 
         if PathBar._shared_recent_paths is None:
@@ -2905,6 +3506,7 @@ class PathBar(QWidget):
         wrap.addWidget(self._btn_copy, 0)
 
         self._host.installEventFilter(self); self._edit.installEventFilter(self)
+        self._pin_pending = False
         self.set_path(self._current_path)
 
     def _copy_current_path(self):
@@ -3193,39 +3795,39 @@ class PathBar(QWidget):
             parts.append((root,root)); sub=p[len(root):].strip("\\/")
             for seg in [s for s in sub.split(os.sep) if s]:
                 curr=os.path.join(parts[-1][1], seg); parts.append((seg,curr))
-        fm=self.fontMetrics()
+        fm=self.fontMetrics(); elide=fm.elidedText; seg_w=CRUMB_MAX_SEG_W; hlay=self._hlay; host=self._host
+        # Widths are summed as crumbs are built; every separator is identical, so it is measured once.
+        item_w = 0; item_n = 0; sep_w = None; last = len(parts)-1
         for i,(label,target) in enumerate(parts):
-            btn=QPushButton(self._host); btn.setObjectName("crumb"); btn.setFlat(True); btn.setCursor(Qt.PointingHandCursor)
-            elided=fm.elidedText(label, Qt.ElideMiddle, CRUMB_MAX_SEG_W)
-            btn.setText(elided); btn.setToolTip(label); btn.setMinimumHeight(UI_H)
+            btn=QPushButton(host); btn.setObjectName("crumb"); btn.setFlat(True); btn.setCursor(Qt.PointingHandCursor)
+            btn.setText(elide(label, Qt.ElideMiddle, seg_w)); btn.setToolTip(label); btn.setMinimumHeight(UI_H)
             btn.clicked.connect(lambda _,t=target: self.pathSubmitted.emit(t))
-            self._hlay.addWidget(btn)
-            if i < len(parts)-1:
-                s=QLabel(">", self._host); s.setObjectName("crumbSep"); s.setContentsMargins(0,0,0,0); self._hlay.addWidget(s)
-        self._hlay.activate()
-        m = self._hlay.contentsMargins()
-        item_w = 0
-        item_n = 0
-        for i in range(self._hlay.count()):
-            it = self._hlay.itemAt(i)
-            w = it.widget() if it else None
-            if w is None:
-                continue
-            item_w += max(0, w.sizeHint().width())
-            item_n += 1
+            hlay.addWidget(btn); item_w += max(0, btn.sizeHint().width()); item_n += 1
+            if i < last:
+                s=QLabel(">", host); s.setObjectName("crumbSep"); s.setContentsMargins(0,0,0,0); hlay.addWidget(s)
+                if sep_w is None: sep_w = max(0, s.sizeHint().width())
+                item_w += sep_w; item_n += 1
+        hlay.activate()
+        m = hlay.contentsMargins()
         total_w = m.left() + m.right() + item_w + (max(0, item_n - 1) * self._hlay.spacing())
         total_h = max(UI_H, self._hlay.sizeHint().height(), 1)
         self._host.setFixedSize(max(1, total_w), total_h)
         self._host.updateGeometry()
-
-        self._pin_to_right()
-        QTimer.singleShot(0, self._pin_to_right)
+        self._schedule_pin()
 
     def resizeEvent(self, ev):
         super().resizeEvent(ev)
+        self._schedule_pin()
+
+    def _schedule_pin(self):
+        # Rebuilds and resizes arriving in one event-loop pass share a single deferred pin.
+        if self._pin_pending:
+            return
+        self._pin_pending = True
         QTimer.singleShot(0, self._pin_to_right)
 
     def _pin_to_right(self):
+        self._pin_pending = False
         try:
             if not (hasattr(self, "_hbar") and self._hbar):
                 return
@@ -3244,79 +3846,41 @@ class PathBar(QWidget):
             pass
 
 
-class SearchResultModel(QStandardItemModel):
-    def data(self, index, role=Qt.DisplayRole):
-        if role == Qt.TextAlignmentRole:
-            c = index.column()
-            if c in (1, 2, 3):
-                return int(Qt.AlignRight | Qt.AlignVCenter)
-        if role == Qt.DisplayRole and index.column() == 1:
-            b = super().data(index, SIZE_BYTES_ROLE)
-            if b is None:
-                b = super().data(index, Qt.EditRole)
-            if isinstance(b, (int, float)) and b:
-                return human_size(int(b))
-            return ""
-        return super().data(index, role)
-
-
-    def mimeTypes(self):
-
-        return ["text/uri-list"]
-
-    def mimeData(self, indexes):
-        md = QtCore.QMimeData()
-
-        rows = set()
-        for ix in indexes:
-            if ix.isValid():
-                rows.add(ix.row())
-
-        from PyQt5.QtCore import QUrl
-        urls = []
-        for r in rows:
-            it = self.item(r, 0)
-            if not it:
-                continue
-            path = it.data(Qt.UserRole)
-            if path:
-                urls.append(QUrl.fromLocalFile(path))
-
-        md.setUrls(urls)
-        return md
-
-    def flags(self, index):
-
-        f = super().flags(index)
-        if index.isValid():
-            f |= Qt.ItemIsDragEnabled
-        return f
-
+class SearchResultModel(FastDirModel):
+    # Same column storage as FastDirModel; hits span many folders, so full paths and the relative folder are kept per row.
+    HEADERS = ["Name", "Size", "Ext", "Date Modified", "Folder"]
+    def _clear_rows(self):
+        super()._clear_rows(); self._paths=[]; self._folders=[]; self._folder_fold=[]
+    def _build_dispatch(self):
+        super()._build_dispatch()
+        self._dispatch[(Qt.DisplayRole, 4)] = self._dispatch[(Qt.EditRole, 4)] = self._folder_at
+    def _folder_at(self, row): return self._folders[row]
+    def _folder_fold_at(self, row):
+        ff = self._folder_fold[row]
+        if ff is None:
+            ff = self._folder_fold[row] = self._folders[row].casefold()
+        return ff
+    def _index_rows(self, start:int, names:list):
+        self._row_of.update(zip(map(os.path.normcase, self._paths[start:]), range(start, start+len(names))))
+    def row_path(self, row:int)->str: return self._paths[row] if 0<=row<len(self._paths) else ""
+    def row_for_path(self, path:str)->int: return self._row_of.get(os.path.normcase(path), -1) if path else -1
+    def append_records(self, recs:list):
+        # recs: SearchWorker result dicts; "size"/"mtime" are present when the walk already had stat data.
+        names=[]; is_dirs=[]; exts=[]; sizes=array("q"); mtimes=array("d"); paths=[]; folders=[]
+        for rec in recs:
+            name=rec.get("name", ""); isdir=bool(rec.get("is_dir", False)); mt=rec.get("mtime")
+            names.append(name); is_dirs.append(isdir); exts.append("" if isdir else _name_extension(name))
+            paths.append(rec.get("path", "")); folders.append(rec.get("folder", ""))
+            if mt is None:
+                sizes.append(_NO_SIZE); mtimes.append(_NO_MTIME)
+            else:
+                sizes.append(int(rec.get("size") or 0)); mtimes.append(float(mt))
+        if not names: return
+        self._paths.extend(paths); self._folders.extend(folders); self._folder_fold.extend([None]*len(folders))
+        self.append_rows([names, is_dirs, exts, sizes, mtimes])
     def supportedDragActions(self):
-
         return Qt.CopyAction
 
-    def startDrag(self, supportedActions):
-
-        from PyQt5.QtGui import QDrag
-        md = QtCore.QMimeData()
-
-
-        paths = [p for p in self.pane._selected_paths() if p and os.path.exists(p)]
-        if not paths:
-            return
-
-
-        md.setUrls([QUrl.fromLocalFile(p) for p in paths])
-        md.setText("\r\n".join(paths))
-
-        drag = QDrag(self)
-        drag.setMimeData(md)
-
-
-        drag.exec_(Qt.CopyAction | Qt.MoveAction, Qt.CopyAction)
-
-
 
 class SearchFolderDelegate(QStyledItemDelegate):
     def initStyleOption(self, option, index):
@@ -3529,6 +4093,47 @@ class BulkRenameDialog(QDialog):
         ]
 
 
+_CONFLICT_ACTIONS = ("Overwrite", "Skip", "Copy")
+
+class _ConflictModel(QAbstractTableModel):
+    HEADERS = ["Name", "Destination", "Action"]
+    def __init__(self, conflicts, parent=None):
+        super().__init__(parent)
+        self._names = [os.path.basename(src) for src, _dst in conflicts]
+        self._dsts = [dst for _src, dst in conflicts]
+        self._actions = [_CONFLICT_ACTIONS[0]] * len(conflicts)
+    def actions(self): return list(self._actions)
+    def rowCount(self, parent=QtCore.QModelIndex()): return 0 if parent.isValid() else len(self._names)
+    def columnCount(self, parent=QtCore.QModelIndex()): return 3
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        return self.HEADERS[section] if role==Qt.DisplayRole and orientation==Qt.Horizontal else super().headerData(section, orientation, role)
+    def flags(self, index):
+        f = super().flags(index)
+        return f | Qt.ItemIsEditable if index.isValid() and index.column() == 2 else f
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or role not in (Qt.DisplayRole, Qt.EditRole): return None
+        c = index.column(); row = index.row()
+        return self._names[row] if c == 0 else (self._dsts[row] if c == 1 else self._actions[row])
+    def setData(self, index, value, role=Qt.EditRole):
+        if not index.isValid() or index.column() != 2 or value not in _CONFLICT_ACTIONS: return False
+        self._actions[index.row()] = value; self.dataChanged.emit(index, index, [Qt.DisplayRole, Qt.EditRole])
+        return True
+    def set_all(self, which:str):
+        if which not in _CONFLICT_ACTIONS or not self._actions: return
+        self._actions = [which] * len(self._actions)
+        self.dataChanged.emit(self.index(0, 2), self.index(len(self._actions) - 1, 2), [Qt.DisplayRole, Qt.EditRole])
+
+class _ConflictActionDelegate(QStyledItemDelegate):
+    def createEditor(self, parent, option, index):
+        combo = QComboBox(parent); combo.addItems(list(_CONFLICT_ACTIONS))
+        combo.activated.connect(lambda _i, c=combo: self.commitData.emit(c))
+        return combo
+    def setEditorData(self, editor, index):
+        i = editor.findText(str(index.data(Qt.EditRole) or ""))
+        if i >= 0: editor.setCurrentIndex(i)
+    def setModelData(self, editor, model, index):
+        model.setData(index, editor.currentText(), Qt.EditRole)
+
 class ConflictResolutionDialog(QDialog):
     def __init__(self, parent, conflicts:list[tuple[str,str]], dst_dir:str):
         super().__init__(parent)
@@ -3554,20 +4159,16 @@ class ConflictResolutionDialog(QDialog):
         lay.addLayout(top)
 
 
-        self.tbl = _setup_readonly_table(
-            QTableWidget(self),
-            ["Name", "Destination", "Action"],
-            [QHeaderView.ResizeToContents, QHeaderView.Stretch, QHeaderView.ResizeToContents],
-            row_count=len(conflicts),
-        )
-        self._combos = []
-        for r, (src, dst) in enumerate(conflicts):
-            name = os.path.basename(src)
-            _set_table_row_items(self.tbl, r, name, dst)
-            combo = QComboBox(self.tbl)
-            combo.addItems(["Overwrite", "Skip", "Copy"])
-            self.tbl.setCellWidget(r, 2, combo)
-            self._combos.append(combo)
+        # Model/delegate instead of per-row items and combo widgets: a combo exists only while a cell is edited.
+        self._model = _ConflictModel(conflicts, self)
+        self.tbl = QTableView(self); self.tbl.setModel(self._model)
+        self.tbl.setItemDelegateForColumn(2, _ConflictActionDelegate(self.tbl))
+        self.tbl.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.tbl.setEditTriggers(QAbstractItemView.AllEditTriggers)
+        self.tbl.verticalHeader().setDefaultSectionSize(UI_H + 2 * ROW_SPACING)
+        header = self.tbl.horizontalHeader()
+        for col, mode in enumerate([QHeaderView.ResizeToContents, QHeaderView.Stretch, QHeaderView.ResizeToContents]):
+            header.setSectionResizeMode(col, mode)
         lay.addWidget(self.tbl, 1)
         _add_dialog_button_box(lay, self, QDialogButtonBox.Ok | QDialogButtonBox.Cancel, self.accept, self.reject)
         btn_over.clicked.connect(lambda: self._apply_all("Overwrite"))
@@ -3580,25 +4181,19 @@ class ConflictResolutionDialog(QDialog):
                 QPalette.Text: (0, 0, 0), QPalette.ButtonText: (0, 0, 0), QPalette.WindowText: (0, 0, 0),
             })
             self.setStyleSheet("""
-                QDialog, QLabel, QTableWidget, QLineEdit { color: #000000; background: #FFFFFF; }
+                QDialog, QLabel, QTableView, QLineEdit { color: #000000; background: #FFFFFF; }
                 QHeaderView::section { color: #000000; background: #F1F3F7; border: 0; border-right: 1px solid #E5E8EE; }
                 QComboBox { color: #000000; background: #FFFFFF; border: 1px solid #D0D5DD; border-radius: 6px; padding: 2px 6px; }
                 QComboBox:hover { border: 1px solid #5E9BFF; }
                 QComboBox QAbstractItemView { color: #000000; background: #FFFFFF; }
-                QTableWidget QTableCornerButton::section { background: #FFFFFF; }
+                QTableView QTableCornerButton::section { background: #FFFFFF; }
             """)
 
     def _apply_all(self, which:str):
-        for c in self._combos:
-            idx = c.findText(which)
-            if idx >= 0: c.setCurrentIndex(idx)
+        self._model.set_all(which)
 
     def result_map(self) -> dict:
-        return {
-            src: (choice if choice in ("overwrite", "skip", "copy") else "overwrite")
-            for (src, _dst), combo in zip(self._conflicts, self._combos)
-            for choice in [combo.currentText().strip().lower()]
-        }
+        return {src: action.lower() for (src, _dst), action in zip(self._conflicts, self._model.actions())}
 
 
 class ExplorerView(QTreeView):
@@ -3775,6 +4370,9 @@ class ExplorerView(QTreeView):
 
 
 
+# Volume label -> (status text, perf_counter stamp); shared so panes on the same volume reuse one query.
+_DISK_FREE_CACHE = {}
+
 class ExplorerPane(QWidget):
     requestBackgroundOp=pyqtSignal(str, list, str)
     _FALLBACK_NEW_ACTION_SPECS = (
@@ -3805,7 +4403,7 @@ class ExplorerPane(QWidget):
 
         self._load_sort_settings()
 
-        self.set_path(start_path or QDir.homePath(), push_history=False)
+        self.set_path(start_path or _home(), push_history=False)
         self._update_star_button(); self._rebuild_quick_bookmark_buttons()
 
         self._connect_signals()
@@ -3818,8 +4416,9 @@ class ExplorerPane(QWidget):
     def _init_state(self):
         self._search_mode=False; self._search_model=None; self._search_proxy=None
         self._search_pending_items={}; self._search_stats_done=set(); self._search_stat_worker=None
-        self._search_stat_queue=[]; self._search_stat_pending=set()
+        self._search_stat_queue=deque(); self._search_stat_pending=set()
         self._search_running = False
+        self._default_icons={}; self._ext_icon_cache={}
         self._back_stack=[]; self._fwd_stack=[]; self._undo_stack=[]
         self._last_hover_index=QtCore.QModelIndex(); self._tooltip_last_ms=0.0; self._tooltip_interval_ms=180; self._tooltip_last_text=""
         self._tooltip_display_ms = 36000
@@ -3837,6 +4436,7 @@ class ExplorerPane(QWidget):
         self._fast_enum_done = False
         self._large_folder_mode = False
         self._deferred_normal_load_path = None
+        self._pending_select_path = None
         self._file_worker=None
         self._op_progress_dialog=None
         self._dirload_timer={}
@@ -3845,17 +4445,17 @@ class ExplorerPane(QWidget):
         self._search_sort_column = 0
         self._search_sort_order = Qt.AscendingOrder
         self._header_resize_guard = False
+        self._autofit_pending = False
+        self._autofit_last = 0.0
         self._browse_name_min_width = 140
         self._visible_stats_interval_ms = 60
         self._visible_stats_timer = None
+        self._visible_stats_dirty = False
         self._selection_update_interval_ms = 120
         self._selection_update_timer = None
         self._selection_cache_sig = None
         self._selection_cache_data = (0, False, 0)
         self._selection_cache_ts = 0.0
-        self._disk_free_cache_key = None
-        self._disk_free_cache_text = ""
-        self._disk_free_cache_ts = 0.0
         self._disk_free_ttl_s = 2.0
         self._fs_change_generation = 0
 
@@ -3928,8 +4528,7 @@ class ExplorerPane(QWidget):
         try: self.source_model.setResolveSymlinks(False)
         except Exception: pass
         self.source_model.setFilter(QDir.AllEntries|QDir.NoDotAndDotDot|QDir.Hidden|QDir.System|QDir.Drives|QDir.AllDirs)
-        self._native_icons=QFileIconProvider()
-        self._generic_icons=GenericIconProvider(self.style())
+        self._native_icons, self._generic_icons = _shared_icon_providers()
         self._icon_provider_mode="native"
         if ALWAYS_GENERIC_ICONS:
             self.source_model.setIconProvider(self._generic_icons)
@@ -4002,14 +4601,21 @@ class ExplorerPane(QWidget):
             header.blockSignals(False)
             self._header_resize_guard = False
 
-    def _schedule_browse_name_autofit(self):
-        if self._search_mode:
+    def _schedule_browse_name_autofit(self, delay_ms: int = 0):
+        if self._search_mode or self._autofit_pending:
             return
-        QTimer.singleShot(0, self._autofit_browse_name_column)
+        self._autofit_pending = True
+        QTimer.singleShot(delay_ms, self._autofit_browse_name_column)
 
     def _autofit_browse_name_column(self):
+        self._autofit_pending = False
         if self._search_mode:
             return
+        # At most one autofit per frame; defer (not drop) so the final drag size still lands.
+        elapsed_ms = (time.perf_counter() - self._autofit_last) * 1000.0
+        if elapsed_ms < 16.0:
+            self._schedule_browse_name_autofit(int(16.0 - elapsed_ms) + 1)
+            return
         v = getattr(self, "view", None)
         if v is None:
             return
@@ -4028,6 +4634,7 @@ class ExplorerPane(QWidget):
         target = max(self._browse_name_min_width, target)
         if abs(header.sectionSize(0) - target) <= 1:
             return
+        self._autofit_last = time.perf_counter()
         self._header_resize_guard = True
         try:
             header.blockSignals(True)
@@ -4185,13 +4792,11 @@ class ExplorerPane(QWidget):
         self.filter_edit.returnPressed.connect(self._apply_filter)
         self.btn_search.clicked.connect(self._on_search_button_clicked)
         self.filter_edit.textChanged.connect(self._on_filter_text_changed)
-        try: self.view.verticalScrollBar().valueChanged.connect(lambda _v: self._request_visible_stats())
+        try: self.view.verticalScrollBar().valueChanged.connect(self._on_view_scrolled)
         except Exception: pass
-        try: self.proxy.rowsInserted.connect(lambda *_: self._request_visible_stats(0))
-        except Exception: pass
-        try: self.proxy.modelReset.connect(lambda: self._request_visible_stats(0))
-        except Exception: pass
-        try: self.proxy.layoutChanged.connect(lambda *_: self._request_visible_stats(0))
+        try:
+            for sig in (self.proxy.rowsInserted, self.proxy.modelReset, self.proxy.layoutChanged):
+                sig.connect(self._mark_visible_stats_dirty)
         except Exception: pass
 
     def _register_shortcuts(self):
@@ -4240,9 +4845,9 @@ class ExplorerPane(QWidget):
 
     def _load_sort_settings(self):
         try:
-            s = QSettings(ORG_NAME, APP_NAME)
-            self._sort_column = s.value(f"pane_{self.pane_id}/sort_column", 0, type=int)
-            order_val = s.value(f"pane_{self.pane_id}/sort_order", Qt.AscendingOrder, type=int)
+            # Served from the shared sort snapshot: one QSettings scan for all panes, kept current by saves.
+            self._sort_column = int(_sort_setting(f"pane_{self.pane_id}/sort_column", 0))
+            order_val = int(_sort_setting(f"pane_{self.pane_id}/sort_order", int(Qt.AscendingOrder)))
             self._sort_order = Qt.DescendingOrder if order_val == Qt.DescendingOrder else Qt.AscendingOrder
         except Exception:
             self._sort_column = 0
@@ -4252,10 +4857,8 @@ class ExplorerPane(QWidget):
 
     def _save_sort_settings(self):
         try:
-            s = QSettings(ORG_NAME, APP_NAME)
-            s.setValue(f"pane_{self.pane_id}/sort_column", self._sort_column)
-            s.setValue(f"pane_{self.pane_id}/sort_order", int(self._sort_order))
-            s.sync()
+            _queue_setting(f"pane_{self.pane_id}/sort_column", self._sort_column)
+            _queue_setting(f"pane_{self.pane_id}/sort_order", int(self._sort_order))
         except Exception:
             pass
 
@@ -4461,7 +5064,6 @@ class ExplorerPane(QWidget):
 
     def _select_visible_path(self, target_path: str, focus: bool = False) -> bool:
         target_path = nice_path(target_path)
-        target_key = os.path.normcase(target_path)
 
         try:
             if focus and self.view and not self.view.hasFocus():
@@ -4474,19 +5076,17 @@ class ExplorerPane(QWidget):
 
         try:
             if self._using_fast:
-                rows = self._fast_model.rowCount()
-                for r in range(rows):
-                    rp = self._fast_model.row_path(r)
-                    if rp and os.path.normcase(rp) == target_key:
-                        prx_ix = self._fast_proxy.index(r, 0)
-                        sm = self.view.selectionModel()
-                        sm.clearSelection()
-                        sm.select(prx_ix, QtCore.QItemSelectionModel.Select | QtCore.QItemSelectionModel.Rows)
-                        self.view.scrollTo(prx_ix, QAbstractItemView.PositionAtCenter)
-                        self.view.setCurrentIndex(prx_ix)
-                        return True
+                r = self._fast_model.row_for_path(target_path)
+                if r >= 0:
+                    prx_ix = self._fast_proxy.mapFromSource(self._fast_model.index(r, 0))
+                    sm = self.view.selectionModel()
+                    sm.clearSelection()
+                    sm.select(prx_ix, QtCore.QItemSelectionModel.Select | QtCore.QItemSelectionModel.Rows)
+                    self.view.scrollTo(prx_ix, QAbstractItemView.PositionAtCenter)
+                    self.view.setCurrentIndex(prx_ix)
+                    return True
             else:
-                src_ix = self.source_model.index(target_path)
+                src_ix = self._normal_index_for_path(target_path)
                 if src_ix.isValid():
                     st_ix = self.stat_proxy.mapFromSource(src_ix)
                     prx_ix = self.proxy.mapFromSource(st_ix)
@@ -4544,7 +5144,20 @@ class ExplorerPane(QWidget):
         except Exception:
             pass
 
-    def _stop_worker_thread(self, w, wait_ms: int = 100, label: str = "") -> bool:
+    @staticmethod
+    def _hook_worker_cleanup(w):
+        # Connected once per worker at creation. Some workers shadow QThread.finished with their own signal
+        # emitted from inside run(), so the slot joins the (exiting) thread before deleting it.
+        def _cleanup():
+            try:
+                w.wait()
+                w.deleteLater()
+            except Exception:
+                pass
+        w.finished.connect(_cleanup)
+
+    def _stop_worker_thread(self, w, wait_ms: int = 0, label: str = "") -> bool:
+        # wait_ms <= 0 cancels and returns at once; only shutdown passes a bounded wait.
         if not w:
             return True
         try:
@@ -4554,15 +5167,8 @@ class ExplorerPane(QWidget):
                         w.cancel()
                 except Exception:
                     pass
-                if not w.wait(wait_ms):
-                    # Don't block UI; defer deletion after thread finishes.
-                    try:
-                        w.finished.connect(w.deleteLater, QtCore.Qt.UniqueConnection)
-                    except Exception:
-                        try:
-                            w.finished.connect(w.deleteLater)
-                        except Exception:
-                            pass
+                if wait_ms <= 0 or not w.wait(wait_ms):
+                    # Don't block UI; the cleanup hooked at creation deletes it once run() has returned.
                     if DEBUG and label:
                         dlog(f"[thread] deferred cleanup: {label}")
                     return False
@@ -4571,15 +5177,15 @@ class ExplorerPane(QWidget):
         except Exception:
             return False
 
-    def _cancel_search_worker(self):
+    def _cancel_search_worker(self, wait_ms: int = 0):
 
-        self._stop_worker_thread(getattr(self, "_search_worker", None), 120, "search")
+        self._stop_worker_thread(getattr(self, "_search_worker", None), wait_ms, "search")
         self._search_worker = None
-        self._stop_worker_thread(getattr(self, "_search_stat_worker", None), 80, "search-stat")
+        self._stop_worker_thread(getattr(self, "_search_stat_worker", None), wait_ms, "search-stat")
         self._search_stat_worker = None
         self._search_pending_items = {}
         self._search_stats_done = set()
-        self._search_stat_queue = []
+        self._search_stat_queue = deque()
         self._search_stat_pending = set()
         try:
             while QApplication.overrideCursor() is not None:
@@ -4590,46 +5196,18 @@ class ExplorerPane(QWidget):
 
     @QtCore.pyqtSlot(str, list)
     def _on_search_batch(self, base_path: str, rows: list):
-        if not self._search_mode or not self._search_model:
+        if not self._search_mode or not self._search_model or self.sender() is not self._search_worker:
             return
-        root_item = self._search_model.invisibleRootItem()
-
-        for rec in rows:
-            name = rec.get("name", "")
-            full = rec.get("path", "")
-            isdir = bool(rec.get("is_dir", False))
-            rel_folder = rec.get("folder", "")
-
-            item_name = QStandardItem(name)
-            item_name.setData(full, Qt.UserRole)
-            item_name.setData(isdir, IS_DIR_ROLE)
-            item_name.setData(str(name).lower(), NAME_FOLD_ROLE)
-            item_name.setData(False, SEARCH_ICON_READY_ROLE)
-            item_name.setData(full, Qt.ToolTipRole)
-
-            item_name.setIcon(self._default_icon(isdir))
-
-
-            item_size = QStandardItem()
-            item_size.setData(0, Qt.EditRole)
-            item_size.setData(0, SIZE_BYTES_ROLE)
-
-            ext = file_extension_label(name, isdir)
-            item_ext = QStandardItem(ext)
-            item_ext.setData(ext, Qt.EditRole)
-
-            item_date = QStandardItem("")
-            item_date.setData(QDateTime(), Qt.EditRole)
-
-            item_folder = QStandardItem(rel_folder)
-
-            root_item.appendRow([item_name, item_size, item_ext, item_date, item_folder])
-
+        self._search_model.append_records(rows)
+        # Rows that arrived with stat data never need the stat worker.
+        self._search_stats_done.update(rec["path"] for rec in rows if rec.get("mtime") is not None)
 
         self._request_visible_stats(0)
 
-    @QtCore.pyqtSlot()
-    def _on_search_finished(self):
+    def _on_search_finished(self, worker=None):
+        # A cancelled worker's finished can land after the next search started; only the live one resets state.
+        if worker is not self._search_worker:
+            return
         try:
             if QApplication.overrideCursor() is not None:
                 QApplication.restoreOverrideCursor()
@@ -4640,17 +5218,19 @@ class ExplorerPane(QWidget):
         try:
             if self._search_mode and self._search_proxy and self.view.model() is self._search_proxy:
                 hdr = self.view.header()
-                col = hdr.sortIndicatorSection()
-                order = hdr.sortIndicatorOrder()
-                if not self.view.isSortingEnabled():
+                # Rows were appended unsorted (dynamicSortFilter is off); sort exactly once here.
+                # setSortingEnabled(True) already sorts by the header's indicator, so only call sortByColumn otherwise.
+                if self.view.isSortingEnabled():
+                    self.view.sortByColumn(hdr.sortIndicatorSection(), hdr.sortIndicatorOrder())
+                else:
                     self.view.setSortingEnabled(True)
-                self.view.sortByColumn(col, order)
         except Exception:
             pass
 
         self._request_visible_stats(0)
 
-    def _start_next_search_stat_worker(self, batch_limit: int = 220):
+    def _start_next_search_stat_worker(self):
+        # One worker drains the shared queue; paths appended while it runs are picked up by the same thread.
         cur = getattr(self, "_search_stat_worker", None)
         if cur and cur.isRunning():
             return
@@ -4658,33 +5238,27 @@ class ExplorerPane(QWidget):
             self._search_stat_worker = None
             return
 
-        size = max(1, int(batch_limit))
-        batch = self._search_stat_queue[:size]
-        del self._search_stat_queue[:size]
-
-        w = NormalStatWorker(batch, self)
-        w.statReady.connect(self._apply_search_stat, Qt.QueuedConnection)
-        w.finishedCycle.connect(lambda b=batch: self._on_search_stat_cycle_finished(b), Qt.QueuedConnection)
+        w = NormalStatWorker((), self, feed=self._search_stat_queue)
+        w.statsReady.connect(self._apply_search_stats, Qt.QueuedConnection)
+        w.finishedCycle.connect(lambda w=w: self._on_search_stat_cycle_finished(w), Qt.QueuedConnection)
+        self._hook_worker_cleanup(w)
         self._search_stat_worker = w
         w.start()
 
-    def _enqueue_search_stat_paths(self, paths: list[str], batch_limit: int = 220):
-        added = False
-        for p in paths:
-            if not p:
-                continue
-            if p in self._search_stat_pending:
-                continue
-            self._search_stat_pending.add(p)
-            self._search_stat_queue.append(p)
-            added = True
-        if added:
-            self._start_next_search_stat_worker(batch_limit=batch_limit)
+    def _enqueue_search_stat_paths(self, paths: list[str]):
+        pending = self._search_stat_pending
+        new = [p for p in dict.fromkeys(paths) if p and p not in pending]
+        if new:
+            pending.update(new)
+            self._search_stat_queue.extend(new)
+            self._start_next_search_stat_worker()
 
-    def _on_search_stat_cycle_finished(self, batch):
-        for p in batch:
-            self._search_stat_pending.discard(p)
+    def _on_search_stat_cycle_finished(self, worker=None):
+        # A cancelled worker's cycle can finish after the next search started its own; leave that one alone.
+        if worker is not self._search_stat_worker:
+            return
         self._search_stat_worker = None
+        # Covers paths appended just after the worker saw an empty queue.
         if self._search_mode:
             self._start_next_search_stat_worker()
 
@@ -4693,32 +5267,30 @@ class ExplorerPane(QWidget):
         if not (text or "").strip():
             self._enter_browse_mode()
 
-    @QtCore.pyqtSlot(str, object, object)
-    def _apply_search_stat(self, path: str, size_val, mtime_val):
-
-        d = getattr(self, "_search_pending_items", None)
-        if not isinstance(d, dict):
-            return
-        pair = d.pop(path, None)
-        if not pair:
-            return
-        item_size, item_date = pair
-        try:
-            sv = int(size_val or 0)
-        except Exception:
-            sv = 0
-        item_size.setData(sv, Qt.EditRole)
-        item_size.setData(sv, SIZE_BYTES_ROLE)
-
-        if mtime_val is not None:
-            try:
-                dt = QDateTime.fromSecsSinceEpoch(int(mtime_val))
-                item_date.setData(dt, Qt.EditRole)
-                item_date.setData(dt.toString(LIST_DATETIME_FMT), Qt.DisplayRole)
-            except Exception:
-                item_date.setData(QDateTime(), Qt.EditRole)
-                item_date.setData("", Qt.DisplayRole)
-
+    @QtCore.pyqtSlot(list)
+    def _apply_search_stats(self, batch: list):
+        pending = self._search_stat_pending; rows = self._search_pending_items; hits = []
+        for path, size_val, mtime_val, date_txt in batch:
+            pending.discard(path)
+            row = rows.pop(path, None)
+            if row is not None:
+                hits.append((row, size_val, mtime_val, date_txt))
+        if hits and self._search_model is not None:
+            self._search_model.apply_stats_bulk(hits)
+
+    def _select_pending_path(self, final: bool = False):
+        # final: the target folder has finished its first load, so a miss will not be retried.
+        new_path = self._pending_select_path
+        if new_path and (self._select_visible_path(new_path) or final):
+            self._pending_select_path = None
+
+    def _normal_index_for_path(self, path: str):
+        # Only children of the shown root are looked up; QFileSystemModel.index(path) is a C++ hash lookup there.
+        root_ix = self.stat_proxy.mapToSource(self.proxy.mapToSource(self.view.rootIndex()))
+        if not root_ix.isValid() or _path_key(os.path.dirname(path)) != _path_key(self.source_model.filePath(root_ix)):
+            return QtCore.QModelIndex()
+        ix = self.source_model.index(path)
+        return ix if ix.isValid() and ix.parent() == root_ix else QtCore.QModelIndex()
 
     def create_text_file(self):
         base_dir = self.current_path()
@@ -4733,50 +5305,16 @@ class ExplorerPane(QWidget):
         self.hard_refresh()
 
 
-        def _try_select():
-
-            try:
-                if self.view and not self.view.hasFocus():
-                    self.view.setFocus(Qt.ShortcutFocusReason)
-            except Exception:
-                pass
-
-
-            if self._search_mode:
-                return
-
-            try:
-                if self._using_fast:
-
-                    rows = self._fast_model.rowCount()
-                    for r in range(rows):
-                        rp = self._fast_model.row_path(r)
-                        if rp and os.path.normcase(rp) == os.path.normcase(new_path):
-                            prx_ix = self._fast_proxy.index(r, 0)
-                            sm = self.view.selectionModel()
-                            sm.clearSelection()
-                            sm.select(prx_ix, QtCore.QItemSelectionModel.Select | QtCore.QItemSelectionModel.Rows)
-                            self.view.scrollTo(prx_ix, QAbstractItemView.PositionAtCenter)
-                            self.view.setCurrentIndex(prx_ix)
-                            return
-                else:
-
-                    src_ix = self.source_model.index(new_path)
-                    if src_ix.isValid():
-                        st_ix = self.stat_proxy.mapFromSource(src_ix)
-                        prx_ix = self.proxy.mapFromSource(st_ix)
-                        sm = self.view.selectionModel()
-                        sm.clearSelection()
-                        sm.select(prx_ix, QtCore.QItemSelectionModel.Select | QtCore.QItemSelectionModel.Rows)
-                        self.view.scrollTo(prx_ix, QAbstractItemView.PositionAtCenter)
-                        self.view.setCurrentIndex(prx_ix)
-                        return
-            except Exception:
-                pass
-
+        try:
+            if self.view and not self.view.hasFocus():
+                self.view.setFocus(Qt.ShortcutFocusReason)
+        except Exception:
+            pass
 
-        for delay in (0, 80, 200, 450):
-            QTimer.singleShot(delay, _try_select)
+        # Selected once the reload that hard_refresh started has delivered the new row; the
+        # zero-delay attempt covers a model that already lists it.
+        self._pending_select_path = new_path
+        QTimer.singleShot(0, self._select_pending_path)
 
         try:
             self.host.flash_status("Text file created")
@@ -4784,17 +5322,42 @@ class ExplorerPane(QWidget):
             pass
 
     def _default_icon(self, is_dir: bool) -> QIcon:
+        icon = self._default_icons.get(is_dir)
+        if icon is not None:
+            return icon
         try:
             if ALWAYS_GENERIC_ICONS:
-                return self._generic_icons.icon(QFileIconProvider.Folder if is_dir else QFileIconProvider.File)
-            return self.style().standardIcon(QStyle.SP_DirIcon if is_dir else QStyle.SP_FileIcon)
+                icon = self._generic_icons.icon(QFileIconProvider.Folder if is_dir else QFileIconProvider.File)
+            else:
+                icon = self.style().standardIcon(QStyle.SP_DirIcon if is_dir else QStyle.SP_FileIcon)
         except Exception: return QIcon()
+        self._default_icons[is_dir] = icon
+        return icon
+
+    def _search_icon_for(self, p: str, is_dir: bool):
+        # Plain files share their type's icon, so one fileIcon() per extension and provider mode is enough;
+        # folders and self-iconed types (exe, lnk, ...) still resolve per path.
+        ext = "" if is_dir else file_extension_label(p)
+        key = (self._icon_provider_mode, ext) if ext and ext not in _PER_FILE_ICON_EXTS else None
+        if key is not None:
+            icon = self._ext_icon_cache.get(key)
+            if icon is not None:
+                return icon
+        idx = self.source_model.index(p)
+        if not idx.isValid():
+            return None
+        icon = self.source_model.fileIcon(idx)
+        if not icon or icon.isNull():
+            return None
+        if key is not None:
+            self._ext_icon_cache[key] = icon
+        return icon
 
-    def _cancel_fast_stat_worker(self):
-        self._stop_worker_thread(self._fast_stat_worker, 120, "fast-stat")
+    def _cancel_fast_stat_worker(self, wait_ms: int = 0):
+        self._stop_worker_thread(self._fast_stat_worker, wait_ms, "fast-stat")
         self._fast_stat_worker=None
 
-    def _cancel_enum_worker(self, wait_ms: int = 150):
+    def _cancel_enum_worker(self, wait_ms: int = 0):
         self._stop_worker_thread(self._enum_worker, wait_ms, "dir-enum")
         self._enum_worker = None
 
@@ -4816,11 +5379,11 @@ class ExplorerPane(QWidget):
 
     def shutdown(self, wait_ms: int = 300):
         try:
-            self._cancel_search_worker()
+            self._cancel_search_worker(wait_ms)
         except Exception:
             pass
         try:
-            self._cancel_fast_stat_worker()
+            self._cancel_fast_stat_worker(wait_ms)
         except Exception:
             pass
         try:
@@ -4841,6 +5404,16 @@ class ExplorerPane(QWidget):
         t.timeout.connect(self._schedule_visible_stats)
         self._visible_stats_timer = t
 
+    def _on_view_scrolled(self, _value):
+        self._request_visible_stats()
+
+    def _mark_visible_stats_dirty(self, *_):
+        # Model churn arrives in bursts; the first signal queues an immediate pass and the rest only see the flag.
+        if self._visible_stats_dirty:
+            return
+        self._visible_stats_dirty = True
+        self._request_visible_stats(0)
+
     def _request_visible_stats(self, delay_ms: int | None = None):
         self._ensure_visible_stats_timer()
         t = self._visible_stats_timer
@@ -4947,27 +5520,24 @@ class ExplorerPane(QWidget):
 
     def _update_free_space_label(self, force: bool = False):
         path = self.current_path()
-        if self._is_network_path(path):
-            self.lbl_free.setText("")
-            return
-
         key = self._drive_label(path)
         now = time.perf_counter()
-        if (not force and self._disk_free_cache_key == key
-            and (now - self._disk_free_cache_ts) <= self._disk_free_ttl_s):
-            self.lbl_free.setText(self._disk_free_cache_text)
-            return
-
-        try:
-            _total, _used, free = shutil.disk_usage(path)
-            text = f"{key} free {human_size(free)}"
-        except Exception:
+        hit = _DISK_FREE_CACHE.get(key)
+        if not force and hit is not None and (now - hit[1]) <= self._disk_free_ttl_s:
+            text = hit[0]
+        else:
+            # Network volumes are left blank; the drive-type probe is also only paid on a cache miss.
             text = ""
+            if not self._is_network_path(path):
+                try:
+                    _total, _used, free = shutil.disk_usage(path)
+                    text = f"{key} free {human_size(free)}"
+                except Exception:
+                    pass
+            _DISK_FREE_CACHE[key] = (text, now)
 
-        self._disk_free_cache_key = key
-        self._disk_free_cache_text = text
-        self._disk_free_cache_ts = now
-        self.lbl_free.setText(text)
+        if self.lbl_free.text() != text:
+            self.lbl_free.setText(text)
 
     def _flush_selection_status_update(self):
         self._render_selection_status(update_statusbar=True, update_label=True, update_free=True)
@@ -4997,6 +5567,7 @@ class ExplorerPane(QWidget):
             self._update_free_space_label(force=False)
 
     def _schedule_visible_stats(self):
+        self._visible_stats_dirty = False
 
         if self._search_mode:
             self._fill_search_visible_icons()
@@ -5049,12 +5620,14 @@ class ExplorerPane(QWidget):
                 return
             root = self._fast_model.rootPath()
             w = FastStatWorker(self._fast_model, root, to_rows, self)
-            w.statReady.connect(self._fast_model.apply_stat, Qt.QueuedConnection)
+            # A cancelled worker may still have batches queued; drop them instead of applying them to the next folder.
+            w.statsReady.connect(lambda b, w=w: self._fast_stat_worker is w and self._fast_model.apply_stats_bulk(b), Qt.QueuedConnection)
             def _on_fast_cycle_finished():
                 if self._fast_stat_worker is w:
                     self._fast_stat_worker = None
                 self._request_visible_stats(0)
             w.finishedCycle.connect(_on_fast_cycle_finished, QtCore.Qt.QueuedConnection)
+            self._hook_worker_cleanup(w)
             self._fast_stat_worker = w
             w.start()
             return
@@ -5399,7 +5972,7 @@ class ExplorerPane(QWidget):
     def _use_fast_model(self, path: str):
 
         self._cancel_fast_stat_worker()
-        self._cancel_enum_worker(wait_ms=100)
+        self._cancel_enum_worker()
         try:
             self.stat_proxy.clear_cache()
         except Exception:
@@ -5451,9 +6024,14 @@ class ExplorerPane(QWidget):
         )
 
 
+        worker = self._enum_worker
+        self._hook_worker_cleanup(worker)
+
         def _on_batch(rows):
+            if self._enum_worker is not worker:
+                return
             self._fast_model.append_rows(rows)
-            self._fast_enum_count += len(rows or [])
+            self._fast_enum_count += len(rows[0]) if rows else 0
             if self._fast_enum_count >= LARGE_FOLDER_THRESHOLD:
                 self._set_large_folder_mode(True, count=self._fast_enum_count, complete=False)
             self._fast_batch_counter += 1
@@ -5480,6 +6058,8 @@ class ExplorerPane(QWidget):
 
 
         def _on_finished():
+            if self._enum_worker is not worker:
+                return
             try:
                 self._fast_enum_done = True
 
@@ -5490,6 +6070,7 @@ class ExplorerPane(QWidget):
 
 
                 _restore_apply_icon()
+                self._select_pending_path(final=True)
 
 
                 self._request_visible_stats(0)
@@ -5662,6 +6243,8 @@ class ExplorerPane(QWidget):
 
             if self._search_mode:
                 self._enter_browse_mode()
+            # A selection queued for the previous folder must not fire when this one loads.
+            self._pending_select_path = None
 
             cur = getattr(self.path_bar, "_current_path", None)
             if push_history and cur and os.path.normcase(cur) != os.path.normcase(path):
@@ -5765,6 +6348,11 @@ class ExplorerPane(QWidget):
             ms = self._dirload_timer[key].elapsed()
             dlog(f"directoryLoaded: '{loaded_path}' in {ms} ms")
             self._dirload_timer.pop(key, None)
+        pending = self._pending_select_path
+        if pending:
+            # The fast view is finalised by its own enumeration, not by the normal model's load.
+            self._select_pending_path(final=(not self._using_fast
+                                             and _path_key(loaded_path) == _path_key(os.path.dirname(pending))))
 
 
         if self._pending_normal_root is None:
@@ -5793,7 +6381,7 @@ class ExplorerPane(QWidget):
             except Exception:
                 pass
 
-    def current_path(self)->str: return self.path_bar._current_path or QDir.homePath()
+    def current_path(self)->str: return self.path_bar._current_path or _home()
     def go_back(self):
         if not self._back_stack: return
         dst=self._back_stack.pop(); self._fwd_stack.append(self.current_path()); self.set_path(dst, push_history=False)
@@ -5815,7 +6403,7 @@ class ExplorerPane(QWidget):
             return
         try: self._cancel_fast_stat_worker()
         except Exception: pass
-        try: self._cancel_enum_worker(wait_ms=100)
+        try: self._cancel_enum_worker()
         except Exception: pass
         try: self.stat_proxy.clear_cache()
         except Exception: pass
@@ -6200,6 +6788,7 @@ class ExplorerPane(QWidget):
             self.host.flash_status("No items to rename")
             return
 
+        import uuid
         temp_pairs = []
         committed = []
         try:
@@ -6232,13 +6821,10 @@ class ExplorerPane(QWidget):
         self.host.flash_status(f"Renamed {len(committed)} item(s)")
 
     def _undo_remove_created(self, paths: list[str]) -> bool:
-        failed = []
         hwnd = int(self.window().winId()) if sys.platform == "win32" else 0
-        for p in reversed(list(paths or [])):
-            if not p or not os.path.exists(p):
-                continue
-            if not recycle_path_to_trash(p, hwnd):
-                failed.append(p)
+        targets = [p for p in reversed(list(paths or [])) if p and os.path.exists(p)]
+        recycle_to_trash(targets, hwnd)
+        failed = [p for p in targets if _path_exists_for_delete(p)]
         if failed:
             sample = "\n".join(failed[:8])
             more = "\n..." if len(failed) > 8 else ""
@@ -6334,7 +6920,7 @@ class ExplorerPane(QWidget):
 
         self._request_visible_stats(0)
 
-    def _enter_search_mode(self, model:QStandardItemModel):
+    def _enter_search_mode(self, model:SearchResultModel):
         self._sync_sort_state_from_view()
         self._cancel_fast_stat_worker()
         self._using_fast=False
@@ -6369,14 +6955,13 @@ class ExplorerPane(QWidget):
 
 
         model = SearchResultModel(self)
-        model.setHorizontalHeaderLabels(["Name", "Size", "Ext", "Date Modified", "Folder"])
         self._enter_search_mode(model)
 
 
         self._search_pending_items = {}
         self._search_stats_done = set()
         self._search_stat_worker = None
-        self._search_stat_queue = []
+        self._search_stat_queue = deque()
         self._search_stat_pending = set()
 
 
@@ -6387,7 +6972,8 @@ class ExplorerPane(QWidget):
         w.truncated.connect(lambda n: self.host.statusBar().showMessage(
             f"Search capped at {n} results. Refine filter to narrow results.", 6000
         ))
-        w.finished.connect(self._on_search_finished, Qt.QueuedConnection)
+        w.finished.connect(lambda w=w: self._on_search_finished(w), Qt.QueuedConnection)
+        self._hook_worker_cleanup(w)
 
         QApplication.setOverrideCursor(Qt.WaitCursor)
         self._set_search_button_state(True)
@@ -6406,46 +6992,44 @@ class ExplorerPane(QWidget):
         start = top_ix.row() if top_ix.isValid() else 0
         rc = self._search_proxy.rowCount(root_ix)
         end = bot_ix.row() if bot_ix.isValid() else min(start + 200, rc - 1)
+        # Real icons are resolved for on-screen rows only; stats are prefetched over a wider margin.
+        icon_lo, icon_hi = start, end
         start = max(0, start - 40)
         end = min(rc - 1, end + 100)
         if end < start:
             end = start
 
         paths_need_stat = []
+        model = self._search_model; proxy = self._search_proxy
+        stats_done = self._search_stats_done; pending_rows = self._search_pending_items
 
         for r in range(start, end + 1):
-            prx_ix = self._search_proxy.index(r, 0, root_ix)
+            prx_ix = proxy.index(r, 0, root_ix)
             if not prx_ix.isValid():
                 continue
-            src_ix = self._search_proxy.mapToSource(prx_ix)
+            src_ix = proxy.mapToSource(prx_ix)
             if not src_ix.isValid():
                 continue
-            item_name = self._search_model.item(src_ix.row(), 0)
-            item_size = self._search_model.item(src_ix.row(), 1)
-            item_date = self._search_model.item(src_ix.row(), 3)
-            if not item_name:
+            row = src_ix.row()
+            p = model.row_path(row)
+            if not p:
                 continue
-
-            p = item_name.data(Qt.UserRole)
-            isdir = bool(item_name.data(IS_DIR_ROLE))
+            isdir = model.row_is_dir(row)
 
 
-            if p and not bool(item_name.data(SEARCH_ICON_READY_ROLE)):
-                idx = self.source_model.index(p)
-                if idx.isValid():
-                    icon = self.source_model.fileIcon(idx)
-                    if icon and not icon.isNull():
-                        item_name.setIcon(icon)
-                item_name.setData(True, SEARCH_ICON_READY_ROLE)
+            if icon_lo <= r <= icon_hi and not model.has_icon(row):
+                # Failed lookups still store the default icon so the row is not retried on every pass.
+                icon = self._search_icon_for(p, isdir)
+                model.apply_icon(row, icon if icon is not None else self._default_icon(isdir))
 
 
-            if p and not isdir and p not in getattr(self, "_search_stats_done", set()):
-                self._search_pending_items[p] = (item_size, item_date)
+            if not isdir and p not in stats_done:
+                pending_rows[p] = row
                 paths_need_stat.append(p)
-                self._search_stats_done.add(p)
+                stats_done.add(p)
 
         if paths_need_stat:
-            self._enqueue_search_stat_paths(paths_need_stat, batch_limit=220)
+            self._enqueue_search_stat_paths(paths_need_stat)
 
     def _build_fallback_new_actions(self, menu: QMenu):
         return {
@@ -6727,10 +7311,7 @@ class MultiExplorer(QMainWindow):
             prev_count = 0
         if prev_count > 0:
             try:
-                prev_paths = self._current_paths()
-                s = QSettings(ORG_NAME, APP_NAME)
-                s.setValue(f"layout/last_paths_{prev_count}", prev_paths)
-                s.sync()
+                _queue_setting(f"layout/last_paths_{prev_count}", self._current_paths())
             except Exception:
                 pass
 
@@ -6739,15 +7320,14 @@ class MultiExplorer(QMainWindow):
 
         final_paths = list(start_paths or [])[:n]
         if len(final_paths) < n:
-            s = QSettings(ORG_NAME, APP_NAME)
-            saved = s.value(f"layout/last_paths_{n}", [])
+            saved = _setting_value(f"layout/last_paths_{n}", [])
             if not isinstance(saved, list):
                 saved = []
             base_len = len(final_paths)
             for i in range(base_len, n):
                 cand = saved[i] if i < len(saved) else None
                 if not cand or not os.path.exists(str(cand)):
-                    cand = QDir.homePath()
+                    cand = _home()
                 final_paths.append(str(cand))
 
 
@@ -7052,12 +7632,12 @@ class MultiExplorer(QMainWindow):
             except Exception:
                 pass
 
-        settings=QSettings(ORG_NAME, APP_NAME)
-        settings.setValue("window/geometry", self.saveGeometry())
-        settings.setValue("layout/pane_count", len(paths) if paths else len(self.panes))
+        _queue_setting("window/geometry", self.saveGeometry())
+        _queue_setting("layout/pane_count", len(paths) if paths else len(self.panes))
         for i,p in enumerate(paths if paths else [x.current_path() for x in self.panes]):
-            settings.setValue(f"layout/pane_{i}_path", p)
-        settings.sync(); super().closeEvent(e)
+            save_pane_path(i, p)
+        if _SETTINGS_FLUSH_TIMER is not None: _SETTINGS_FLUSH_TIMER.stop()
+        _flush_pending_settings(sync=True); super().closeEvent(e)
 
 
     def _get_sessions(self) -> list:
@@ -7236,27 +7816,36 @@ class BookmarkEditDialog(QDialog):
             QTableWidget(self),
             ["Enabled", "Name", "Path"],
             [QHeaderView.ResizeToContents, QHeaderView.ResizeToContents, QHeaderView.Stretch],
+            row_count=BOOKMARK_LIMIT, cell_widgets=True,
         )
-        self.table.setRowCount(BOOKMARK_LIMIT)
         self._rows = []
         lay = QVBoxLayout(self); lay.addWidget(self.table, 1)
         _add_dialog_button_box(lay, self, QDialogButtonBox.Ok | QDialogButtonBox.Cancel, self.accept, self.reject)
         items = list(items or [])
         for i in range(BOOKMARK_LIMIT):
-            it = items[i] if i < len(items) else _empty_bookmark_item()
+            it = items[i] if i < len(items) else _EMPTY_BOOKMARK
             self._add_row(i, it)
 
+    def _add_clear_action(self, edit: QLineEdit):
+        if not hasattr(self, "_clear_icon"):
+            self._clear_icon = self.style().standardIcon(QStyle.SP_LineEditClearButton)
+        act = edit.addAction(self._clear_icon, QLineEdit.TrailingPosition)
+        act.setToolTip("Clear"); act.triggered.connect(edit.clear)
+        # Like the built-in clear button, only show it while there is text to clear.
+        act.setVisible(bool(edit.text()))
+        edit.textChanged.connect(lambda t, a=act: a.setVisible(bool(t)))
+
     def _add_row(self, row: int, data: dict):
         chk = QCheckBox(self.table); chk.setChecked(bool(data.get("enabled", False)))
         self.table.setCellWidget(row, 0, chk)
         name_edit = QLineEdit(self.table); name_edit.setText(str(data.get("name", "")))
-        name_edit.setPlaceholderText("Bookmark name"); name_edit.setClearButtonEnabled(True); name_edit.setFixedHeight(UI_H)
+        name_edit.setPlaceholderText("Bookmark name"); self._add_clear_action(name_edit); name_edit.setFixedHeight(UI_H)
         self.table.setCellWidget(row, 1, name_edit)
         path_wrap = QWidget(self.table); h = QHBoxLayout(path_wrap); h.setContentsMargins(0,0,0,0); h.setSpacing(ROW_SPACING)
-        path_edit = QLineEdit(path_wrap); path_edit.setText(str(data.get("path", ""))); path_edit.setPlaceholderText("Folder path"); path_edit.setClearButtonEnabled(True); path_edit.setFixedHeight(UI_H)
+        path_edit = QLineEdit(path_wrap); path_edit.setText(str(data.get("path", ""))); path_edit.setPlaceholderText("Folder path"); self._add_clear_action(path_edit); path_edit.setFixedHeight(UI_H)
         btn = QToolButton(path_wrap); btn.setText("..."); btn.setFixedHeight(UI_H)
         def browse():
-            start = path_edit.text().strip() or QDir.homePath()
+            start = path_edit.text().strip() or _home()
             d = QFileDialog.getExistingDirectory(self, "Select Folder", start)
             if d: path_edit.setText(d)
         btn.clicked.connect(browse)
@@ -7265,17 +7854,20 @@ class BookmarkEditDialog(QDialog):
         self._rows.append((chk, name_edit, path_edit))
 
     def values(self) -> list:
-        return [
-            {"enabled": enabled, "name": name, "path": path}
-            for chk, name_edit, path_edit in self._rows
-            for enabled, name, path in [(chk.isChecked(), name_edit.text().strip(), path_edit.text().strip())]
-            if name or path or enabled
-        ]
+        out = []
+        for chk, name_edit, path_edit in self._rows:
+            enabled = chk.isChecked(); name = name_edit.text(); path = path_edit.text()
+            if not (enabled or name or path):
+                continue
+            name = name.strip(); path = path.strip()
+            if enabled or name or path:
+                out.append({"enabled": enabled, "name": name, "path": path})
+        return out
 
     def set_items(self, items: list):
         items = list(items or [])
         for r in range(BOOKMARK_LIMIT):
-            it = items[r] if r < len(items) else _empty_bookmark_item()
+            it = items[r] if r < len(items) else _EMPTY_BOOKMARK
             chk, name_edit, path_edit = self._rows[r]
             chk.setChecked(bool(it.get("enabled", False)))
             name_edit.setText(str(it.get("name", "")))
@@ -7284,15 +7876,21 @@ class BookmarkEditDialog(QDialog):
 
 
 def _load_start_paths(desired_panes:int, cli_paths):
-    s=QSettings(ORG_NAME, APP_NAME); cli_paths=list(cli_paths or []); paths=[]
+    s=QSettings(ORG_NAME, APP_NAME); cli_paths=[os.path.normpath(p) if p else "" for p in (cli_paths or [])]; paths=[]
     for i in range(desired_panes):
-        if i<len(cli_paths) and os.path.exists(cli_paths[i]):
-            paths.append(cli_paths[i]); continue
-        p=s.value(f"layout/pane_{i}_path", QDir.homePath(), type=str)
-        paths.append(p if p and os.path.exists(p) else QDir.homePath())
+        p=cli_paths[i] if i<len(cli_paths) else ""
+        if p and os.path.isdir(p):
+            paths.append(p); continue
+        p=s.value(f"layout/pane_{i}_path", "", type=str)
+        p=os.path.normpath(p) if p else ""
+        ok=bool(p) and os.path.isdir(p)
+        paths.append(p if ok else _home())
     return paths
 
 def parse_args():
+    if len(sys.argv)<=1:
+        return SimpleNamespace(paths=[], panes=6, debug=False)
+    import argparse
     ap=argparse.ArgumentParser(description="Multi-Pane File Explorer (PyQt5)")
     ap.add_argument("paths", nargs="*", help="Optional start paths per pane")
     ap.add_argument("--panes", type=int, choices=[4,6,8], default=6, help="Number of panes: 4, 6 or 8")
@@ -7307,7 +7905,9 @@ def main():
     QApplication.setAttribute(Qt.AA_EnableHighDpiScaling, True)
     QApplication.setAttribute(Qt.AA_UseHighDpiPixmaps, True)
     app=QApplication(sys.argv)
-    base_font=QFont("Segoe UI"); base_font.setPointSizeF(FONT_PT); app.setFont(base_font)
+    QPixmapCache.setCacheLimit(PIXMAP_CACHE_KB)
+    base_font=QFont("Segoe UI") if sys.platform=="win32" else app.font()
+    base_font.setPointSizeF(FONT_PT); app.setFont(base_font)
     try:
         if hasattr(QGuiApplication,"setHighDpiScaleFactorRoundingPolicy"):
             QGuiApplication.setHighDpiScaleFactorRoundingPolicy(Qt.HighDpiScaleFactorRoundingPolicy.PassThrough)